@@ -112,6 +112,7 @@ class CardView(GlobalNavigationView):
         self._init_history = False
 
         self.current_view = None
+        self.current_page = None
         self.current_context = None
 
         self.defer_refresh = False
@@ -284,6 +285,8 @@ class CardView(GlobalNavigationView):
         """
         Defer configuration rebuild events a short bit.
         """
+        if self.grstate:
+            self.grstate.clear_config_cache()
         if not self.defer_refresh_id:
             self.defer_refresh_id = GObject.timeout_add(
                 3000, self._perform_config_refresh
@@ -364,6 +367,7 @@ class CardView(GlobalNavigationView):
         self.history.clear()
         self._init_history = False
         self.image_service.get_thumbnail_image.cache_clear()
+        self.grstate.clear_cache()
         self._load_config()
         if self.active:
             self.build_tree()
@@ -393,6 +397,7 @@ class CardView(GlobalNavigationView):
         """
         Perform redraw to populate tree.
         """
+        self.grstate.clear_cache()
         self.dirty = True
         if self.active:
             active_object = self.history.present()
@@ -406,12 +411,9 @@ class CardView(GlobalNavigationView):
         """
         Clear view for object change.
         """
-        list(
-            map(
-                self.current_view.remove,
-                self.current_view.get_children(),
-            )
-        )
+        if self.current_page:
+            self.current_page.destroy()
+            self.current_page = None
         if not self.dbstate.is_open():
             self.uistate.status.pop(self.uistate.status_id)
             self.uistate.status.push(
@@ -467,8 +469,8 @@ class CardView(GlobalNavigationView):
         start = time.time()
 
         self._clear_current_view()
-        view = view_builder(self.grstate, page_context)
-        self.current_view.pack_start(view, True, True, 0)
+        self.current_page = view_builder(self.grstate, page_context)
+        self.current_view.pack_start(self.current_page, True, True, 0)
         self.post_render_page()
 
         if page_context.primary_obj.obj_type != "Tag":
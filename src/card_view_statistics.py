@@ -177,10 +177,10 @@ class StatisticsCardView(CardView):
 
         self._clear_current_view()
         self.current_context = GrampsContext()
-        view = view_builder(
+        self.current_page = view_builder(
             self.grstate, self.current_context, hint="Statistics"
         )
-        self.current_view.pack_start(view, True, True, 0)
+        self.current_view.pack_start(self.current_page, True, True, 0)
         self.current_view.show_all()
 
         print(
@@ -59,7 +59,7 @@ class GlobalHistory(Callback):
             secondary_object_hash
         )
 
-    The secondary_object_hash is a sha256 hash of the json serialized object
+    The secondary_object_hash is a blake2b hash of the serialized object
     that is used as a signature for the object so it can be identified. In
     order for this hash to remain valid when secondary objects are updated
     the replace_secondary method should be called to update the hash as part
@@ -243,10 +243,10 @@ class MediaBarItem(MediaRefCard):
         mobj = media
         if not mobj:
             mobj = self.fetch("Media", media_ref.ref)
-        if mobj and mobj.mime[0:5] == "image":
+        if mobj and mobj.mime.startswith("image"):
             rectangle = None
-            if media_ref and crop:
-                rectangle = media_ref.get_rectangle()
+            if media_ref and crop and media_ref.get_rectangle():
+                rectangle = tuple(media_ref.get_rectangle())
             path = media_path_full(self.grstate.dbstate.db, mobj.path)
             pixbuf = images_service.get_thumbnail_image(path, rectangle, size)
             image = Gtk.Image()
@@ -66,6 +66,7 @@ class AttributeCard(SecondaryCard):
 
     def __init__(self, grstate, groptions, obj, attribute):
         SecondaryCard.__init__(self, grstate, groptions, obj, attribute)
+        self.is_reference = self.primary.is_reference
         self.__add_attribute_title(attribute)
         self.__add_attribute_value(attribute)
         self.enable_drag()
@@ -79,7 +80,7 @@ class AttributeCard(SecondaryCard):
         Add attribute title.
         """
         name = glocale.translation.sgettext(attribute.get_type().xml_str())
-        if "Ref" not in self.primary.obj_type:
+        if not self.is_reference:
             label = self.get_link(
                 name,
                 self.primary.obj_type,
@@ -87,14 +88,13 @@ class AttributeCard(SecondaryCard):
                 callback=self.switch_attribute_page,
             )
         else:
-            name = "<b>%s</b>" % escape(name)
             label = Gtk.Label(
                 halign=Gtk.Align.START,
                 wrap=True,
                 xalign=0.0,
                 justify=Gtk.Justification.LEFT,
             )
-            label.set_markup(name)
+            label.set_markup("<b>%s</b>" % escape(name))
         self.widgets["title"].pack_start(label, False, False, 0)
 
     def __add_attribute_value(self, attribute):
@@ -115,5 +115,5 @@ class AttributeCard(SecondaryCard):
         """
         Route the action if the card was clicked on.
         """
-        if "Ref" not in self.primary.obj_type:
+        if not self.is_reference:
             SecondaryCard.route_action(self, obj, event)
@@ -28,7 +28,6 @@ EventCard.
 #
 # ------------------------------------------------------------------------
 from gramps.gen.const import GRAMPS_LOCALE as glocale
-from gramps.gen.display.place import displayer as place_displayer
 from gramps.gen.lib import EventType
 from gramps.gen.utils.alive import probably_alive
 from gramps.gui.ddtargets import DdTargets
@@ -48,7 +47,20 @@ from ..common.common_utils import (
     get_person_color_css,
     get_relationship_color_css,
 )
-from ..common.common_strings import NONE, UNKNOWN, UNTITLED
+from ..common.common_strings import (
+    CITATION,
+    CITATIONS,
+    IMPLICIT_FAMILY,
+    NO_CITATIONS,
+    NO_SOURCES,
+    NONE,
+    OF,
+    PARTICIPANTS,
+    SOURCE,
+    SOURCES,
+    UNKNOWN,
+    UNTITLED,
+)
 from ..common.common_vitals import (
     check_multiple_events,
     get_event_category,
@@ -141,8 +153,7 @@ class EventCard(ReferenceCard):
         age_base = self.groptions.age_base
         if event_date and age_base:
             if self.groptions.context in ["timeline"]:
-                if self.grstate.config.get("timeline.person.show-age"):
-                    self.load_age(age_base, event_date)
+                self.load_age(age_base, event_date)
             elif self.grstate.config.get("group.event.show-age"):
                 self.load_age(age_base, event_date)
 
@@ -158,7 +169,7 @@ class EventCard(ReferenceCard):
         """
         Add event place.
         """
-        name = place_displayer.display_event(self.grstate.dbstate.db, event)
+        name = self.grstate.display_place(event)
         if name:
             place = self.get_link(
                 name,
@@ -178,7 +189,7 @@ class EventCard(ReferenceCard):
             if not text and self.primary_participant:
                 text = "%s %s %s" % (
                     event_type,
-                    _("of"),
+                    OF,
                     self.primary_participant[3],
                 )
             elif not text:
@@ -199,7 +210,7 @@ class EventCard(ReferenceCard):
                 )
                 self.add_fact(
                     self.get_label(
-                        "%s %s" % (_("Participants"), participant_text)
+                        "%s %s" % (PARTICIPANTS, participant_text)
                     )
                 )
 
@@ -240,10 +251,8 @@ class EventCard(ReferenceCard):
             role = primary_obj_event_ref.get_role()
         self.__set_role_type(role)
         role_name = str(role)
-        title = "%s %s %s" % (event_type, _("of"), primary_obj_name)
+        text = primary_obj_name
         if self.reference_base:
-            if self.reference_base.obj.handle == primary_obj.handle:
-                title = self.__adjust_title(title, event_type, primary_obj)
             if (
                 self.groptions.relation
                 and self.reference_base.obj_type == "Person"
@@ -258,9 +267,13 @@ class EventCard(ReferenceCard):
                     self.event_role_type = "implicit"
                     self.event_relationship = relationship
                     text = relationship.split()[0].title()
-                    title = "%s %s %s" % (event_type, _("of"), text)
-                    role_name = "%s: %s" % (_("Implicit Family"), text)
-        return title, role_name
+                    role_name = "%s: %s" % (IMPLICIT_FAMILY, text)
+                    return "%s %s %s" % (event_type, OF, text), role_name
+            if self.reference_base.obj.handle == primary_obj.handle:
+                title = self.__adjust_title(event_type, primary_obj)
+                if title:
+                    return title, role_name
+        return "%s %s %s" % (event_type, OF, text), role_name
 
     def __set_role_type(self, role):
         """
@@ -275,35 +288,36 @@ class EventCard(ReferenceCard):
         if "Unknown" in role.xml_str():
             self.event_role_type = "unknown"
 
-    def __adjust_title(self, title, event_type, primary_obj):
+    def __adjust_title(self, event_type, primary_obj):
         """
-        Adjust title if primary event.
+        Return adjusted title if primary event, or None to use the default.
         """
         if (
-            "family" not in self.groptions.option_space
-            and "place" not in self.groptions.option_space
+            "family" in self.groptions.option_space
+            or "place" in self.groptions.option_space
         ):
-            title = event_type
+            return None
 
-            current_type = self.primary.obj.get_type()
-            if current_type == EventType.BIRTH and check_multiple_events(
-                self.grstate.dbstate.db, primary_obj, EventType.BIRTH
+        title = event_type
+        current_type = self.primary.obj.get_type()
+        if current_type == EventType.BIRTH and check_multiple_events(
+            self.grstate.dbstate.db, primary_obj, EventType.BIRTH
+        ):
+            birth_ref = primary_obj.get_birth_ref()
+            if (
+                birth_ref is not None
+                and birth_ref.ref == self.primary.obj.handle
             ):
-                birth_ref = primary_obj.get_birth_ref()
-                if (
-                    birth_ref is not None
-                    and birth_ref.ref == self.primary.obj.handle
-                ):
-                    title = "%s*" % title
-            elif current_type == EventType.DEATH and check_multiple_events(
-                self.grstate.dbstate.db, primary_obj, EventType.DEATH
+                title = "%s*" % title
+        elif current_type == EventType.DEATH and check_multiple_events(
+            self.grstate.dbstate.db, primary_obj, EventType.DEATH
+        ):
+            death_ref = primary_obj.get_death_ref()
+            if (
+                death_ref is not None
+                and death_ref.ref == self.primary.obj.handle
             ):
-                death_ref = primary_obj.get_death_ref()
-                if (
-                    death_ref is not None
-                    and death_ref.ref == self.primary.obj.handle
-                ):
-                    title = "%s*" % title
+                title = "%s*" % title
         return title
 
     def _load_participants(self):
@@ -361,21 +375,17 @@ class EventCard(ReferenceCard):
         """
         Generate textual description for confidence, source and citation counts.
         """
-        sources = []
-        if self.primary.obj.citation_list:
-            for citation_handle in self.primary.obj.citation_list:
-                citation = self.fetch("Citation", citation_handle)
-                if citation.source_handle not in sources:
-                    sources.append(citation.source_handle)
-                if citation.confidence > self.event_confidence:
-                    self.event_confidence = citation.confidence
+        citation_list = self.primary.obj.citation_list
+        fetch_quality = self.grstate.fetch_citation_quality
+        qualities = [fetch_quality(handle) for handle in citation_list]
+        sources = {source for (source, dummy_var1) in qualities if source}
+        self.event_confidence = max(
+            (confidence for (dummy_var1, confidence) in qualities),
+            default=self.event_confidence,
+        )
         return (
-            get_object_text(sources, _("Source"), _("Sources")),
-            get_object_text(
-                self.primary.obj.citation_list,
-                _("Citation"),
-                _("Citations"),
-            ),
+            get_object_text(sources, SOURCE, SOURCES, NO_SOURCES),
+            get_object_text(citation_list, CITATION, CITATIONS, NO_CITATIONS),
             get_confidence(self.event_confidence),
         )
 
@@ -478,15 +488,13 @@ class EventCard(ReferenceCard):
             )
 
 
-def get_object_text(obj_list, single, plural):
+def get_object_text(obj_list, single, plural, empty):
     """
     Return a text string describing a list.
     """
-    if obj_list:
-        if len(obj_list) == 1:
-            text = "1 %s" % single
-        else:
-            text = "%s %s" % (str(len(obj_list)), plural)
-    else:
-        text = "%s %s" % (_("No"), plural)
-    return text
+    count = len(obj_list)
+    if count == 1:
+        return "1 %s" % single
+    if count:
+        return "%s %s" % (count, plural)
+    return empty
@@ -28,7 +28,6 @@ EventRefCard.
 #
 # ------------------------------------------------------------------------
 from gramps.gen.const import GRAMPS_LOCALE as glocale
-from gramps.gen.display.name import displayer as name_displayer
 from gramps.gen.utils.db import family_name
 from gramps.gui.ddtargets import DdTargets
 
@@ -70,7 +69,7 @@ class EventRefCard(EventCard):
             ):
                 name = None
                 if self.reference_base.obj_type == "Person":
-                    name = name_displayer.display(self.reference_base.obj)
+                    name = grstate.display_name(self.reference_base.obj)
                 elif self.reference_base.obj_type == "Family":
                     name = family_name(
                         self.reference_base.obj, grstate.dbstate.db
@@ -58,7 +58,7 @@ from gramps.gui.editors import EditNote
 from .card_generic import GenericCard
 from .card_widgets import CardGrid
 from ..common.common_strings import NONE
-from ..common.common_utils import format_address, TextLink
+from ..common.common_utils import format_address
 
 _ = GRAMPS_LOCALE.translation.sgettext
 
@@ -98,7 +98,7 @@ class FamilyTreeCard(GenericCard):
             widgets["title"].pack_start(label, False, False, 0)
 
         facts = self.widgets["facts"]
-        list(map(facts.remove, facts.get_children()))
+        facts.foreach(facts.remove)
         if not self.grstate.dbstate.is_open():
             self.add_fact(facts, _("None currently open"), _("Name"))
             return
@@ -137,7 +137,7 @@ class FamilyTreeCard(GenericCard):
             self.add_fact(facts, NONE, _("Active Person"))
 
         facts = self.widgets["facts2"]
-        list(map(facts.remove, facts.get_children()))
+        facts.foreach(facts.remove)
         facts.add_fact(self.get_label(""), self.get_label(_("Description")))
         db_note = self.get_database_description_note()
         if not db_note:
@@ -147,7 +147,7 @@ class FamilyTreeCard(GenericCard):
         facts.add_fact(self.get_label(db_description))
 
         facts = self.widgets["facts3"]
-        list(map(facts.remove, facts.get_children()))
+        facts.foreach(facts.remove)
         researcher = self.grstate.dbstate.db.get_researcher()
         self.add_fact(facts, researcher.name, _("Owner"))
         first = True
@@ -206,9 +206,7 @@ class FamilyTreeCard(GenericCard):
         """
         border = self.grstate.config.get("display.border-width")
         color = self.get_color_css()
-        css = "".join(
-            (".frame { border-width: ", str(border), "px; ", color, " }")
-        )
+        css = ".frame { border-width: %spx; %s }" % (border, color)
         css = css.encode("utf-8")
         provider = Gtk.CssProvider()
         provider.load_from_data(css)
@@ -26,20 +26,12 @@
 GenericCard
 """
 
-# ------------------------------------------------------------------------
-#
-# Python Modules
-#
-# ------------------------------------------------------------------------
-import pickle
-import re
-
 # ------------------------------------------------------------------------
 #
 # GTK Modules
 #
 # ------------------------------------------------------------------------
-from gi.repository import Gdk, Gtk
+from gi.repository import Gtk
 
 # ------------------------------------------------------------------------
 #
@@ -48,11 +40,6 @@ from gi.repository import Gdk, Gtk
 # ------------------------------------------------------------------------
 from gramps.gen.config import config as global_config
 from gramps.gen.const import GRAMPS_LOCALE as glocale
-from gramps.gen.errors import WindowActiveError
-from gramps.gen.lib import Span
-from gramps.gen.utils.db import navigation_label
-from gramps.gui.ddtargets import DdTargets
-from gramps.gui.dialog import WarningDialog
 from gramps.gui.utils import match_primary_mask
 
 # ------------------------------------------------------------------------
@@ -60,16 +47,10 @@ from gramps.gui.utils import match_primary_mask
 # Plugin Modules
 #
 # ------------------------------------------------------------------------
-from ..actions import action_handler
-from ..common.common_classes import GrampsContext, GrampsObject
-from ..common.common_const import (
-    BUTTON_MIDDLE,
-    BUTTON_PRIMARY,
-    BUTTON_SECONDARY,
-)
+from ..common.common_classes import GrampsContext
+from ..common.common_const import BUTTON_PRIMARY, BUTTON_SECONDARY
 from ..common.common_utils import button_pressed, button_released
 from ..menus.menu_bookmarks import build_bookmarks_menu
-from ..menus.menu_config import build_config_menu
 from ..menus.menu_templates import build_templates_menu
 from .card_view import CardView
 
@@ -145,14 +126,9 @@ class GenericCard(CardView):
         """
         border = self.grstate.config.get("display.border-width")
         color = self.get_color_css()
-        self.css = "".join(
-            (
-                ".frame { border: solid; border-radius: 5px; border-width: ",
-                str(border),
-                "px; ",
-                color,
-                " }",
-            )
+        self.css = (
+            ".frame { border: solid; border-radius: 5px; "
+            "border-width: %spx; %s }" % (border, color)
         ).encode("utf-8")
         provider = Gtk.CssProvider()
         provider.load_from_data(self.css)
@@ -127,9 +127,10 @@ class MediaCard(ReferenceCard):
             return
 
         active = "active" in self.groptions.option_space
-        crop = self.get_option("image-mode") in [2, 4]
+        image_mode = self.get_option("image-mode")
+        crop = image_mode in [2, 4]
         size = 0
-        if self.get_option("image-mode") in [3, 4]:
+        if image_mode in [3, 4]:
             size = 2
 
         if self.reference:
@@ -48,11 +48,9 @@ from gi.repository import Gdk, Gtk
 # ------------------------------------------------------------------------
 from gramps.gen.config import config as global_config
 from gramps.gen.const import GRAMPS_LOCALE as glocale
-from gramps.gen.errors import WindowActiveError
 from gramps.gen.lib import Span
 from gramps.gen.utils.db import navigation_label
 from gramps.gui.ddtargets import DdTargets
-from gramps.gui.dialog import WarningDialog
 from gramps.gui.utils import match_primary_mask
 
 # ------------------------------------------------------------------------
@@ -313,13 +311,15 @@ class ObjectCard(CardView):
         """
         Calculate and show age.
         """
-        if "age" in self.widgets:
+        if (
+            "age" in self.widgets
+            and base_date.sortval
+            and current_date.sortval
+        ):
             span = Span(base_date, current_date)
             if span.is_valid():
                 year = str(current_date.get_year())
-                precision = global_config.get(
-                    "preferences.age-display-precision"
-                )
+                precision = self.groptions.age_precision
                 age = str(span.format(precision=precision).strip("()"))
                 if age[:2] == "0 ":
                     age = ""
@@ -399,14 +399,9 @@ class ObjectCard(CardView):
         """
         border = self.grstate.config.get("display.border-width")
         color = self.get_color_css()
-        self.css = "".join(
-            (
-                ".frame { border: solid; border-radius: 5px; border-width: ",
-                str(border),
-                "px; ",
-                color,
-                " }",
-            )
+        self.css = (
+            ".frame { border: solid; border-radius: 5px; "
+            "border-width: %spx; %s }" % (border, color)
         ).encode("utf-8")
         provider = Gtk.CssProvider()
         provider.load_from_data(self.css)
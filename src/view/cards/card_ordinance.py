@@ -28,7 +28,6 @@ LDSOrdinanceCard
 #
 # ------------------------------------------------------------------------
 from gramps.gen.const import GRAMPS_LOCALE as glocale
-from gramps.gen.display.place import displayer as place_displayer
 from gramps.gen.utils.db import family_name
 
 # ------------------------------------------------------------------------
@@ -101,9 +100,7 @@ class LDSOrdinanceCard(SecondaryCard):
         """
         Add ordinance place.
         """
-        text = place_displayer.display_event(
-            self.grstate.dbstate.db, ordinance
-        )
+        text = self.grstate.display_place(ordinance)
         if text:
             place = self.get_link(
                 text,
@@ -37,9 +37,7 @@ from gi.repository import Gtk
 # Gramps Modules
 #
 # ------------------------------------------------------------------------
-from gramps.gen.config import config as global_config
 from gramps.gen.const import GRAMPS_LOCALE as glocale
-from gramps.gen.display.name import displayer as name_displayer
 from gramps.gen.utils.alive import probably_alive
 from gramps.gui.ddtargets import DdTargets
 
@@ -99,7 +97,7 @@ class PersonCard(ReferenceCard):
         """
         Add person title.
         """
-        display_name = name_displayer.display(person)
+        display_name = self.grstate.display_name(person)
         name = self.get_link(display_name, "Person", person.handle)
         name_box = Gtk.HBox(spacing=2)
         if self.groptions.card_number:
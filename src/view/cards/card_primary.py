@@ -148,6 +148,7 @@ class PrimaryCard(ObjectCard):
                 "get_link": self.get_link,
             }
         )
+        fact_list = []
         for count in range(1, 11):
             option = self.get_option(
                 "%s%s" % (option_prefix, str(count)), full=False
@@ -158,11 +159,17 @@ class PrimaryCard(ObjectCard):
                 and len(option) > 1
                 and option[1]
             ):
-                labels = field_builder(
-                    self.grstate, self.primary.obj, option[0], option[1], args
+                fact_list.extend(
+                    field_builder(
+                        self.grstate,
+                        self.primary.obj,
+                        option[0],
+                        option[1],
+                        args,
+                    )
                 )
-                for (label, value) in labels:
-                    grid.add_fact(value, label=label)
+        if fact_list:
+            grid.add_fact_list(fact_list)
 
     def load_attributes(self):
         """
@@ -81,13 +81,9 @@ class TagCard(ObjectCard):
         self.widgets["title"].set_spacing(6)
         self.widgets["title"].pack_start(image, False, False, 0)
 
-        css = "".join(
-            (
-                ".image { margin: 0px; padding: 0px; background-image: none; ",
-                "background-color: ",
-                tag.color[:7],
-                "; }",
-            )
+        css = (
+            ".image { margin: 0px; padding: 0px; background-image: none; "
+            "background-color: %s; }" % tag.color[:7]
         )
         css = css.encode("utf-8")
         provider = Gtk.CssProvider()
@@ -125,9 +121,7 @@ class TagCard(ObjectCard):
         """
         border = self.grstate.config.get("display.border-width")
         color = self.get_color_css()
-        css = "".join(
-            (".frame { border-width: ", str(border), "px; ", color, " }")
-        )
+        css = ".frame { border-width: %spx; %s }" % (border, color)
         css = css.encode("utf-8")
         provider = Gtk.CssProvider()
         provider.load_from_data(css)
@@ -75,7 +75,7 @@ class TextCard(GenericCard):
         Load the title.
         """
         widget = self.widgets["title"]
-        list(map(widget.remove, widget.get_children()))
+        widget.foreach(widget.remove)
         if title:
             label = Gtk.Label(
                 use_markup=True,
@@ -128,9 +128,7 @@ class TextCard(GenericCard):
         """
         border = self.grstate.config.get("display.border-width")
         color = self.get_color_css()
-        css = "".join(
-            (".frame { border-width: ", str(border), "px; ", color, " }")
-        )
+        css = ".frame { border-width: %spx; %s }" % (border, color)
         css = css.encode("utf-8")
         provider = Gtk.CssProvider()
         provider.load_from_data(css)
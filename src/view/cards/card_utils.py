@@ -60,13 +60,9 @@ def get_tag_icon(tag, size=Gtk.IconSize.SMALL_TOOLBAR):
     """
     icon = Gtk.Image()
     icon.set_from_icon_name("gramps-tag", size)
-    css = "".join(
-        (
-            ".image { margin: 0px; padding: 0px; background-image: none; ",
-            "background-color: ",
-            tag.color[:7],
-            "; }",
-        )
+    css = (
+        ".image { margin: 0px; padding: 0px; background-image: none; "
+        "background-color: %s; }" % tag.color[:7]
     )
     css = css.encode("utf-8")
     provider = Gtk.CssProvider()
@@ -89,7 +85,7 @@ def load_metadata(widget, grstate, groptions, grobject, gramps_id=None):
     else:
         icon_size = Gtk.IconSize.LARGE_TOOLBAR
 
-    if "Ref" in obj_type and groptions.ref_mode == 1:
+    if grobject.is_reference and groptions.ref_mode == 1:
         widget.set_halign(Gtk.Align.START)
         add_privacy_indicator(widget, config, obj, icon_size)
         pack_icon(widget, "stock_link", size=icon_size)
@@ -108,7 +104,7 @@ def load_metadata(widget, grstate, groptions, grobject, gramps_id=None):
             add_bookmark_indicator(
                 widget, obj, obj_type, grstate.dbstate.db, icon_size
             )
-        elif "Ref" in obj_type:
+        elif grobject.is_reference:
             pack_icon(widget, "stock_link", size=icon_size)
 
         add_privacy_indicator(widget, config, obj, icon_size)
@@ -138,16 +134,13 @@ def add_bookmark_indicator(widget, obj, obj_type, db, icon_size):
     """
     Add the bookmark indicator if needed.
     """
-    handle = obj.handle
-    for bookmark in get_bookmarks(db, obj_type).get():
-        if bookmark == handle:
-            pack_icon(
-                widget,
-                "gramps-bookmark",
-                size=icon_size,
-                tooltip=_("Bookmarked"),
-            )
-            break
+    if obj.handle in get_bookmarks(db, obj_type).get():
+        pack_icon(
+            widget,
+            "gramps-bookmark",
+            size=icon_size,
+            tooltip=_("Bookmarked"),
+        )
 
 
 def add_privacy_indicator(widget, config, obj, size):
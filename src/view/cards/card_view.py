@@ -241,11 +241,13 @@ class CardView(Gtk.VBox, GrampsConfig):
             size_groups["data"].add_widget(fact_block)
         widgets["body"].pack_start(fact_block, True, True, 0)
         fact_block.pack_start(widgets["title"], False, False, 0)
-        fact_section = Gtk.HBox(hexpand=True, valign=Gtk.Align.START)
-        fact_section.pack_start(widgets["facts"], True, True, 0)
-        if "active" in self.groptions.option_space:
+        if "extra" in widgets:
+            fact_section = Gtk.HBox(hexpand=True, valign=Gtk.Align.START)
+            fact_section.pack_start(widgets["facts"], True, True, 0)
             fact_section.pack_start(widgets["extra"], True, True, 0)
-        fact_block.pack_start(fact_section, True, True, 0)
+            fact_block.pack_start(fact_section, True, True, 0)
+        else:
+            fact_block.pack_start(widgets["facts"], True, True, 0)
         fact_block.pack_end(widgets["icons"], False, False, 0)
 
         attribute_block = Gtk.VBox(halign=Gtk.Align.END, hexpand=False)
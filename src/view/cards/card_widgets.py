@@ -31,7 +31,7 @@ Widgets supporting various sections of the card.
 # GTK Modules
 #
 # ------------------------------------------------------------------------
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 
 # ------------------------------------------------------------------------
 #
@@ -98,7 +98,27 @@ class CardGrid(Gtk.Grid):
             self.attach(fact, 0, self.row, 2, 1)
         self.row += 1
 
+    def add_fact_list(self, fact_list):
+        """
+        Add a list of (label, fact) tuples, holding property notifications
+        until all of them are attached.
+        """
+        self.freeze_notify()
+        row = self.row
+        for (label, fact) in fact_list:
+            if label:
+                self.attach(label, 0, row, 1, 1)
+                self.attach(fact, 1, row, 1, 1)
+            else:
+                self.attach(fact, 0, row, 2, 1)
+            row += 1
+        self.row = row
+        self.thaw_notify()
+
     def add_facts(self, *args):
+        """
+        Add a row of facts, one per column.
+        """
         column = 0
         for arg in args:
             self.attach(arg, column, self.row, 1, 1)
@@ -109,7 +129,7 @@ class CardGrid(Gtk.Grid):
         """
         Clear grid.
         """
-        list(map(self.remove, self.get_children()))
+        self.foreach(self.remove)
         self.row = 0
 
 
@@ -347,6 +367,9 @@ class GrampsImage(Gtk.EventBox):
         self.grstate = grstate
         self.media_ref = None
         self.active = active
+        self.click_handler_id = None
+        self.watch_handlers = []
+        self.watch_args = None
 
         if isinstance(obj, Media):
             self.media = obj
@@ -359,37 +382,128 @@ class GrampsImage(Gtk.EventBox):
         else:
             self.media = None
 
-        if self.media:
+        self.path = None
+        if self.media and self.media.mime.startswith("image"):
             self.path = media_path_full(
                 self.grstate.dbstate.db, self.media.path
             )
 
     def load(self, size=0, crop=True):
         """
-        Load or reload an image.
+        Load or reload an image. The thumbnail is decoded in a worker thread
+        once the image scrolls into view, so decoding does not hold up
+        building the page and images never scrolled to are never decoded.
+        """
+        if self.path:
+            self.__stop_watching()
+            self.watch_args = (size, crop)
+            self.watch_handlers = [
+                (self, self.connect("map", self.__on_map)),
+                (self, self.connect("size-allocate", self.__check_visible)),
+                (self, self.connect("destroy", self.__stop_watching)),
+            ]
+            if self.get_mapped():
+                self.__on_map()
+
+    def __on_map(self, *_dummy_args):
+        """
+        Watch the scroll position of the viewports holding the image and
+        check if it is visible once the page has been laid out.
         """
-        if self.media:
-            list(map(self.remove, self.get_children()))
-            thumbnail = self.__get_thumbnail(size, crop)
-            if thumbnail:
-                self.add(thumbnail)
-                self.connect("button-press-event", self.handle_click)
+        watched = [obj for (obj, dummy_handler_id) in self.watch_handlers]
+        for viewport in self.__get_viewports():
+            for adjustment in (
+                viewport.get_hadjustment(),
+                viewport.get_vadjustment(),
+            ):
+                if adjustment in watched:
+                    continue
+                for signal in ("value-changed", "changed"):
+                    self.watch_handlers.append(
+                        (
+                            adjustment,
+                            adjustment.connect(signal, self.__check_visible),
+                        )
+                    )
+        GLib.idle_add(self.__check_visible)
+
+    def __get_viewports(self):
+        """
+        Return the viewports the image is packed in.
+        """
+        viewports = []
+        widget = self.get_parent()
+        while widget:
+            if isinstance(widget, Gtk.Viewport):
+                viewports.append(widget)
+            widget = widget.get_parent()
+        return viewports
+
+    def __in_view(self):
+        """
+        Test if the image intersects the visible area of its viewports.
+        """
+        allocation = self.get_allocation()
+        for viewport in self.__get_viewports():
+            coords = self.translate_coordinates(viewport.get_child(), 0, 0)
+            if not coords:
+                return False
+            for (start, length, adjustment) in (
+                (coords[0], allocation.width, viewport.get_hadjustment()),
+                (coords[1], allocation.height, viewport.get_vadjustment()),
+            ):
+                top = adjustment.get_value()
+                bottom = top + adjustment.get_page_size()
+                if start + length < top or start > bottom:
+                    return False
+        return True
 
-    def __get_thumbnail(self, size, crop):
+    def __check_visible(self, *_dummy_args):
         """
-        Get the thumbnail image.
+        Queue the thumbnail load once the image is visible.
         """
-        if self.media and self.media.mime[0:5] == "image":
-            rectangle = None
-            if self.media_ref and crop:
-                rectangle = self.media_ref.get_rectangle()
-            pixbuf = images_service.get_thumbnail_image(
-                self.path, rectangle, size
+        if self.watch_args and self.get_mapped() and self.__in_view():
+            (size, crop) = self.watch_args
+            self.__stop_watching()
+            self.__queue_thumbnail(size, crop)
+        return False
+
+    def __stop_watching(self, *_dummy_args):
+        """
+        Disconnect the visibility handlers.
+        """
+        for (obj, handler_id) in self.watch_handlers:
+            obj.disconnect(handler_id)
+        self.watch_handlers = []
+        self.watch_args = None
+
+    def __queue_thumbnail(self, size, crop):
+        """
+        Queue the thumbnail load with the images service.
+        """
+        rectangle = None
+        if self.media_ref and crop and self.media_ref.get_rectangle():
+            rectangle = tuple(self.media_ref.get_rectangle())
+        images_service.queue_thumbnail_image(
+            self.path, rectangle, size, self.__load_thumbnail
+        )
+
+    def __load_thumbnail(self, pixbuf):
+        """
+        Display the thumbnail, unless the image was dropped meanwhile.
+        """
+        if not pixbuf or not self.get_parent():
+            return False
+        self.foreach(self.remove)
+        thumbnail = Gtk.Image()
+        thumbnail.set_from_pixbuf(pixbuf)
+        self.add(thumbnail)
+        thumbnail.show()
+        if not self.click_handler_id:
+            self.click_handler_id = self.connect(
+                "button-press-event", self.handle_click
             )
-            image = Gtk.Image()
-            image.set_from_pixbuf(pixbuf)
-            return image
-        return None
+        return False
 
     def handle_click(self, _dummy_obj, event):
         """
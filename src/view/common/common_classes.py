@@ -31,7 +31,6 @@ Base classes for object and configuration management that others rely on.
 # Python Modules
 #
 # ------------------------------------------------------------------------
-import hashlib
 import pickle
 from abc import abstractmethod
 from html import escape
@@ -51,6 +50,8 @@ from gi.repository import Gtk
 from gramps.gen.config import config as global_config
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 from gramps.gen.db import DbTxn
+from gramps.gen.display.name import displayer as name_displayer
+from gramps.gen.display.place import displayer as place_displayer
 from gramps.gen.errors import HandleError
 from gramps.gen.lib.addressbase import AddressBase
 from gramps.gen.lib.attrbase import AttributeRootBase
@@ -70,19 +71,42 @@ from gramps.gen.lib.urlbase import UrlBase
 # Plugin Modules
 #
 # ------------------------------------------------------------------------
-from .common_const import BUTTON_PRIMARY, GRAMPS_OBJECTS
+from .common_const import BUTTON_PRIMARY
 from .common_utils import (
     TextLink,
     button_pressed,
+    clear_color_css_cache,
+    clear_secondary_hashes,
     find_modified_secondary_object,
     find_reference,
     find_secondary_object,
     get_config_option,
+    get_object_data,
+    get_object_hash,
     prepare_markup,
 )
 
 _ = glocale.translation.sgettext
 
+LEFT_LABEL_ARGS = {
+    "hexpand": True,
+    "vexpand": True,
+    "halign": Gtk.Align.START,
+    "valign": Gtk.Align.START,
+    "justify": Gtk.Justification.LEFT,
+    "wrap": True,
+    "xalign": 0.0,
+}
+RIGHT_LABEL_ARGS = {
+    "hexpand": True,
+    "vexpand": True,
+    "halign": Gtk.Align.END,
+    "valign": Gtk.Align.START,
+    "justify": Gtk.Justification.RIGHT,
+    "wrap": True,
+    "xalign": 1.0,
+}
+
 
 # ------------------------------------------------------------------------
 #
@@ -101,6 +125,7 @@ class GrampsObject:
         "obj_current_hash",
         "dnd_type",
         "dnd_icon",
+        "is_reference",
     )
 
     def __init__(self, obj):
@@ -120,21 +145,17 @@ class GrampsObject:
         self.obj_type = None
         self.obj_current_hash = None
 
-        for obj_type in GRAMPS_OBJECTS:
-            if isinstance(obj, obj_type[0]):
-                (
-                    dummy_var1,
-                    self.obj_type,
-                    self.obj_lang,
-                    self.dnd_type,
-                    self.dnd_icon,
-                ) = obj_type
-                if not self.obj_lang:
-                    self.obj_lang = self.obj_type
-                break
-
-        if not self.obj_type:
+        obj_data = get_object_data(obj)
+        if not obj_data:
             raise AttributeError
+        (
+            dummy_var1,
+            self.obj_type,
+            self.obj_lang,
+            self.dnd_type,
+            self.dnd_icon,
+            self.is_reference,
+        ) = obj_data
 
     @property
     def has_handle(self):
@@ -220,22 +241,12 @@ class GrampsObject:
         """
         return isinstance(self.obj, BasicPrimaryObject)
 
-    @property
-    def is_reference(self):
-        """
-        Return True if object is a reference.
-        """
-        reference = "Ref" in self.obj_type
-        return reference
-
     @property
     def obj_hash(self):
         """
-        Return sha256 hash in digest format.
+        Return object hash in digest format.
         """
-        sha256_hash = hashlib.sha256()
-        sha256_hash.update(str(self.obj.serialize()).encode("utf-8"))
-        return sha256_hash.hexdigest()
+        return get_object_hash(self.obj)
 
     def save_hash(self):
         """
@@ -566,6 +577,11 @@ class GrampsState:
         "page_type",
         "methods",
         "templates",
+        "citations",
+        "backlinks",
+        "names",
+        "places",
+        "options",
     )
 
     def __init__(self, dbstate, uistate, callbacks, config):
@@ -577,6 +593,11 @@ class GrampsState:
         if callbacks:
             self.methods = callbacks.get("methods")
         self.templates = None
+        self.citations = {}
+        self.backlinks = {}
+        self.names = {}
+        self.places = {}
+        self.options = {}
 
     def set_templates(self, templates):
         """
@@ -589,6 +610,7 @@ class GrampsState:
         Set the configation manager.
         """
         self.config = config
+        self.options.clear()
 
     def set_page_type(self, page_type):
         """
@@ -605,6 +627,95 @@ class GrampsState:
         except HandleError:
             return None
 
+    def fetch_citation_quality(self, citation_handle):
+        """
+        Fetches the source handle and confidence for a citation, caching
+        the result as the same citations get examined over and over again.
+        """
+        try:
+            return self.citations[citation_handle]
+        except KeyError:
+            pass
+        citation = self.fetch("Citation", citation_handle)
+        if citation:
+            quality = (citation.source_handle, citation.confidence)
+        else:
+            quality = (None, 0)
+        self.citations[citation_handle] = quality
+        return quality
+
+    def prefetch_citations(self, citation_handles):
+        """
+        Load quality data for a set of citations in a single pass.
+        """
+        for citation_handle in citation_handles:
+            if citation_handle not in self.citations:
+                self.fetch_citation_quality(citation_handle)
+
+    def fetch_backlinks(self, obj_handle):
+        """
+        Fetches the (object type, handle) tuples for all objects referencing
+        an object, caching the result as a backlink scan can be expensive
+        and several groups on a page may need it.
+        """
+        try:
+            return self.backlinks[obj_handle]
+        except KeyError:
+            pass
+        backlinks = list(self.dbstate.db.find_backlink_handles(obj_handle))
+        self.backlinks[obj_handle] = backlinks
+        return backlinks
+
+    def display_name(self, person):
+        """
+        Return display name for a person, caching it as the same people
+        tend to appear on many cards.
+        """
+        try:
+            return self.names[person.handle]
+        except KeyError:
+            pass
+        name = name_displayer.display(person)
+        self.names[person.handle] = name
+        return name
+
+    def display_place(self, event):
+        """
+        Return display name for an event place, caching it by place and
+        date as the place title can vary with the date.
+        """
+        if not event.place:
+            return ""
+        key = (event.place, event.date.serialize())
+        try:
+            return self.places[key]
+        except KeyError:
+            pass
+        name = place_displayer.display_event(self.dbstate.db, event)
+        self.places[key] = name
+        return name
+
+    def clear_cache(self):
+        """
+        Clear cached object and color data, needed whenever the database
+        or configuration changes.
+        """
+        self.clear_config_cache()
+        clear_secondary_hashes()
+        self.citations.clear()
+        self.backlinks.clear()
+        self.names.clear()
+        self.places.clear()
+
+    def clear_config_cache(self):
+        """
+        Clear cached option and color data, needed whenever the
+        configuration changes.
+        """
+        clear_color_css_cache()
+        prepare_markup.cache_clear()
+        self.options.clear()
+
     def fetch_page_context(self):
         """
         Fetches active page context.
@@ -652,10 +763,8 @@ class GrampsState:
         """
         Update old secondary reference for object in the navigation history.
         """
-        sha256_hash = hashlib.sha256()
-        sha256_hash.update(str(obj.serialize()).encode("utf-8"))
         return self.callbacks["update-history-reference"](
-            old_hash, sha256_hash.hexdigest()
+            old_hash, get_object_hash(obj)
         )
 
     def show_group(self, obj, group_type, title=None):
@@ -687,6 +796,25 @@ class GrampsOptions:
     A simple class to encapsulate the options for a Gramps card or list.
     """
 
+    __slots__ = (
+        "option_space",
+        "context",
+        "card_number",
+        "size_groups",
+        "ref_mode",
+        "vertical_orientation",
+        "backlink",
+        "relation",
+        "age_base",
+        "age_precision",
+        "bar_mode",
+        "force_compact",
+        "is_secondary",
+        "maternal_mode",
+        "partners_only",
+        "title",
+    )
+
     def __init__(self, option_space, size_groups=None, card_number=0):
         self.option_space = option_space
         self.context = option_space.split(".")[-1]
@@ -698,15 +826,10 @@ class GrampsOptions:
         self.relation = None
 
         self.age_base = None
+        self.age_precision = 1
 
         if size_groups is None:
-            self.size_groups = {
-                "ref": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
-                "age": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
-                "data": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
-                "attributes": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
-                "image": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
-            }
+            self.size_groups = create_size_groups()
 
     def __getattr__(self, key):
         """
@@ -753,9 +876,25 @@ class GrampsOptions:
 
     def set_age_base(self, value):
         """
-        Set the context.
+        Set the age base date and the precision to display ages with.
         """
         self.age_base = value
+        self.age_precision = global_config.get(
+            "preferences.age-display-precision"
+        )
+
+
+def create_size_groups():
+    """
+    Create the set of size groups used to align card sections.
+    """
+    return {
+        "ref": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
+        "age": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
+        "data": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
+        "attributes": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
+        "image": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
+    }
 
 
 # ------------------------------------------------------------------------
@@ -785,42 +924,35 @@ class GrampsConfig:
         """
         Fetches an option in the card configuration name space.
         """
-        if key[:5] in ["activ", "group"]:
+        option_key = (self.groptions.option_space, key, full)
+        try:
+            return self.grstate.options[option_key]
+        except KeyError:
+            pass
+        if key.startswith(("activ", "group")):
             option = key
         else:
             option = "%s.%s" % (self.groptions.option_space, key)
         try:
-            return get_config_option(self.grstate.config, option, full=full)
+            value = get_config_option(self.grstate.config, option, full=full)
         except AttributeError:
-            return False
+            value = False
+        if isinstance(value, list):
+            value = tuple(value)
+        self.grstate.options[option_key] = value
+        return value
 
     def get_label(self, data, left=True, italic=False):
         """
         Simple helper to prepare a label.
         """
         if left:
-            label = Gtk.Label(
-                hexpand=True,
-                vexpand=True,
-                halign=Gtk.Align.START,
-                valign=Gtk.Align.START,
-                justify=Gtk.Justification.LEFT,
-                wrap=True,
-                xalign=0.0,
-            )
+            label = Gtk.Label(**LEFT_LABEL_ARGS)
         else:
-            label = Gtk.Label(
-                hexpand=True,
-                vexpand=True,
-                halign=Gtk.Align.END,
-                valign=Gtk.Align.START,
-                justify=Gtk.Justification.RIGHT,
-                wrap=True,
-                xalign=1.0,
-            )
-        text = data or ""
-        if text:
-            text = escape(text)
+            label = Gtk.Label(**RIGHT_LABEL_ARGS)
+        text = ""
+        if data:
+            text = escape(data)
         if italic:
             text = "<i>%s</i>" % text
         label.set_markup(self.detail_markup.format(text))
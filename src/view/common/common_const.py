@@ -166,6 +166,18 @@ GRAMPS_OBJECTS = [
     (LdsOrd, "LdsOrd", _("LdsOrd"), None, "gramps-temple"),
 ]
 
+GRAMPS_OBJECT_TYPES = {
+    obj_class: (
+        obj_class,
+        obj_type,
+        obj_lang or obj_type,
+        dnd_type,
+        dnd_icon,
+        "Ref" in obj_type,
+    )
+    for (obj_class, obj_type, obj_lang, dnd_type, dnd_icon) in GRAMPS_OBJECTS
+}
+
 GROUP_LABELS = {
     "address": _("Addresses"),
     "association": _("Associations"),
@@ -272,3 +284,32 @@ PAGE_LABELS = {
     "LdsOrd": _("LDS Ordinance"),
     "Tag": _("Tag"),
 }
+
+BOOKMARK_METHODS = {
+    "Person": "get_bookmarks",
+    "Citation": "get_citation_bookmarks",
+    "Event": "get_event_bookmarks",
+    "Family": "get_family_bookmarks",
+    "Media": "get_media_bookmarks",
+    "Note": "get_note_bookmarks",
+    "Place": "get_place_bookmarks",
+    "Source": "get_source_bookmarks",
+    "Repository": "get_repo_bookmarks",
+}
+
+REFERENCE_LISTS = {
+    "EventRef": "event_ref_list",
+    "ChildRef": "child_ref_list",
+    "MediaRef": "media_list",
+    "PersonRef": "person_ref_list",
+    "RepoRef": "reporef_list",
+}
+
+SECONDARY_LISTS = {
+    "Attribute": "attribute_list",
+    "Address": "address_list",
+    "LdsOrd": "lds_ord_list",
+    "ChildRef": "child_ref_list",
+    "PersonRef": "person_ref_list",
+    "RepoRef": "reporef_list",
+}
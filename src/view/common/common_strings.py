@@ -47,3 +47,12 @@ UNTITLED = "[%s]" % _("Untitled")
 NONE = "[%s]" % _("None")
 UNAVAILABLE = "[%s]" % _("Unavailable")
 MISSING_ORIGIN = "[%s]" % _("Missing Origin")
+SOURCE = _("Source")
+SOURCES = _("Sources")
+CITATION = _("Citation")
+CITATIONS = _("Citations")
+NO_SOURCES = "%s %s" % (_("No"), SOURCES)
+NO_CITATIONS = "%s %s" % (_("No"), CITATIONS)
+OF = _("of")
+PARTICIPANTS = _("Participants")
+IMPLICIT_FAMILY = _("Implicit Family")
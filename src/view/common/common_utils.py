@@ -29,7 +29,9 @@ Common utility functions and classes
 # Python Modules
 #
 # ------------------------------------------------------------------------
-import hashlib
+from collections import Counter
+from functools import lru_cache
+from hashlib import blake2b
 from html import escape
 
 # ------------------------------------------------------------------------
@@ -60,14 +62,27 @@ from .common_const import (
     _KP_ENTER,
     _RETURN,
     _SPACE,
+    BOOKMARK_METHODS,
     BUTTON_PRIMARY,
     CONFIDENCE_COLOR_SCHEME,
+    GRAMPS_OBJECT_TYPES,
     GRAMPS_OBJECTS,
+    REFERENCE_LISTS,
+    SECONDARY_LISTS,
 )
 from .timeline import RELATIVES
 
 _ = glocale.translation.sgettext
 
+SECONDARY_HASHES = {}
+DND_PROVIDERS = {}
+LINK_LABEL_ARGS = {
+    "halign": Gtk.Align.START,
+    "wrap": True,
+    "xalign": 0.0,
+    "justify": Gtk.Justification.LEFT,
+}
+
 
 # ------------------------------------------------------------------------
 #
@@ -99,16 +114,11 @@ class TextLink(Gtk.EventBox):
             self.name = markup.format(self.name)
         if bold:
             self.name = "<b>%s</b>" % self.name
-        self.label = Gtk.Label(
-            hexpand=hexpand,
-            halign=Gtk.Align.START,
-            wrap=True,
-            xalign=0.0,
-            justify=Gtk.Justification.LEFT,
-        )
+        self.label = Gtk.Label(hexpand=hexpand, **LINK_LABEL_ARGS)
         self.label.set_markup(self.name)
         self.add(self.label)
         if callback:
+            self.hover_name = "<u>%s</u>" % self.name
             self.connect("button-press-event", self.validate)
             self.connect("enter-notify-event", self.enter)
             self.connect("leave-notify-event", self.leave)
@@ -128,7 +138,7 @@ class TextLink(Gtk.EventBox):
         """
         Cursor entered so highlight.
         """
-        self.label.set_markup("<u>%s</u>" % self.name)
+        self.label.set_markup(self.hover_name)
 
     def leave(self, _dummy_obj, _dummy_event):
         """
@@ -137,15 +147,29 @@ class TextLink(Gtk.EventBox):
         self.label.set_markup(self.name)
 
 
-def get_object_type(obj, lang=False):
+def get_object_data(obj):
     """
-    Return Gramps object information.
+    Return the resolved Gramps object table entry for an object. Exact
+    types are looked up directly, subclasses fall back to an isinstance scan.
     """
+    obj_data = GRAMPS_OBJECT_TYPES.get(type(obj))
+    if obj_data:
+        return obj_data
     for obj_data in GRAMPS_OBJECTS:
         if isinstance(obj, obj_data[0]):
-            if lang:
-                return obj_data[2]
-            return obj_data[1]
+            return GRAMPS_OBJECT_TYPES[obj_data[0]]
+    return None
+
+
+def get_object_type(obj, lang=False):
+    """
+    Return Gramps object information.
+    """
+    obj_data = get_object_data(obj)
+    if obj_data:
+        if lang:
+            return obj_data[2]
+        return obj_data[1]
     return ""
 
 
@@ -182,11 +206,12 @@ def get_confidence(level):
     return _CONFIDENCE[level]
 
 
-def format_color_css(background, border):
+def format_color_css(background, border, scheme=None):
     """
     Return a formatted css color string.
     """
-    scheme = global_config.get("colors.scheme")
+    if scheme is None:
+        scheme = global_config.get("colors.scheme")
     css = ""
     if background:
         css = "background-color: %s;" % background[scheme]
@@ -195,6 +220,35 @@ def format_color_css(background, border):
     return css
 
 
+def get_color_css(config, background_option, border_option):
+    """
+    Return css color string for a pair of view color options.
+    """
+    return _get_color_css(
+        config,
+        background_option,
+        border_option,
+        global_config.get("colors.scheme"),
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_color_css(config, background_option, border_option, scheme):
+    """
+    Return cached css color string for a pair of options and a scheme.
+    """
+    background = config.get(background_option)
+    border = config.get(border_option)
+    return format_color_css(background, border, scheme)
+
+
+def clear_color_css_cache():
+    """
+    Clear cached css color strings, needed whenever the colors change.
+    """
+    _get_color_css.cache_clear()
+
+
 def get_confidence_color_css(index, config):
     """
     Return css color string based on confidence rating.
@@ -203,9 +257,27 @@ def get_confidence_color_css(index, config):
         return ""
 
     key = CONFIDENCE_COLOR_SCHEME[index]
-    background = config.get("colors.confidence.%s" % key)
-    border = config.get("colors.confidence.border-%s" % key)
-    return format_color_css(background, border)
+    return get_color_css(
+        config,
+        "colors.confidence.%s" % key,
+        "colors.confidence.border-%s" % key,
+    )
+
+
+@lru_cache(maxsize=128)
+def get_relationship_key(relationship):
+    """
+    Return color option key for a relationship description.
+    """
+    index = relationship.lower()
+    if index == "self":
+        return "active"
+    for relative in RELATIVES:
+        if relative in index:
+            if relative in ["wife", "husband"]:
+                return "spouse"
+            return relative
+    return "none"
 
 
 def get_relationship_color_css(relationship, config):
@@ -215,23 +287,12 @@ def get_relationship_color_css(relationship, config):
     if not relationship:
         return ""
 
-    index = relationship.lower()
-    key = None
-    if index == "self":
-        key = "active"
-    else:
-        key = "none"
-        for relative in RELATIVES:
-            if relative in index:
-                if relative in ["wife", "husband"]:
-                    key = "spouse"
-                else:
-                    key = relative
-                break
-
-    background = config.get("colors.relations.%s" % key)
-    border = config.get("colors.relations.border-%s" % key)
-    return format_color_css(background, border)
+    key = get_relationship_key(relationship)
+    return get_color_css(
+        config,
+        "colors.relations.%s" % key,
+        "colors.relations.border-%s" % key,
+    )
 
 
 def get_event_category_color_css(index, config):
@@ -241,9 +302,11 @@ def get_event_category_color_css(index, config):
     if not index:
         return ""
 
-    background = config.get("colors.events.%s" % index)
-    border = config.get("colors.events.border-%s" % index)
-    return format_color_css(background, border)
+    return get_color_css(
+        config,
+        "colors.events.%s" % index,
+        "colors.events.border-%s" % index,
+    )
 
 
 def get_event_role_color_css(index, config):
@@ -253,9 +316,11 @@ def get_event_role_color_css(index, config):
     if not index:
         return ""
 
-    background = config.get("colors.roles.%s" % index)
-    border = config.get("colors.roles.border-%s" % index)
-    return format_color_css(background, border)
+    return get_color_css(
+        config,
+        "colors.roles.%s" % index,
+        "colors.roles.border-%s" % index,
+    )
 
 
 def get_person_color_css(person, living=False, home=None):
@@ -276,25 +341,27 @@ def get_person_color_css(person, living=False, home=None):
     else:
         value = "dead"
 
-    border = global_config.get("colors.border-%s-%s" % (key, value))
+    border_option = "colors.border-%s-%s" % (key, value)
     if home and home.handle == person.handle:
         key = "home"
         value = "person"
-    background = global_config.get("colors.%s-%s" % (key, value))
-    return format_color_css(background, border)
+    return format_color_css(
+        global_config.get("colors.%s-%s" % (key, value)),
+        global_config.get(border_option),
+    )
 
 
 def get_family_color_css(family, divorced=False):
     """
     Return css color string based on family information.
     """
-    background = global_config.get("colors.family")
-    border = global_config.get("colors.border-family")
+    background_option = "colors.family"
+    border_option = "colors.border-family"
 
     if family and family.type is not None:
         key = family.type.value
         if divorced:
-            border = global_config.get("colors.border-family-divorced")
+            border_option = "colors.border-family-divorced"
             key = 99
         values = {
             0: "-married",
@@ -304,8 +371,10 @@ def get_family_color_css(family, divorced=False):
             4: "",
             99: "-divorced",
         }
-        background = global_config.get("colors.family%s" % values[key])
-    return format_color_css(background, border)
+        background_option = "colors.family%s" % values[key]
+    return format_color_css(
+        global_config.get(background_option), global_config.get(border_option)
+    )
 
 
 def get_config_option(config, option, full=False):
@@ -321,10 +390,19 @@ def get_config_option(config, option, full=False):
     if full:
         return option_data
     if option_data:
-        return option_data.split(":")
+        return split_config_option(option_data)
     return "", ""
 
 
+@lru_cache(maxsize=256)
+def split_config_option(option_data):
+    """
+    Split a compound config option value into its parts.
+    """
+    option_type, dummy_sep, option_value = option_data.partition(":")
+    return option_type, option_value
+
+
 def save_config_option(config, option, option_type, option_value=""):
     """
     Save a compound config option.
@@ -353,24 +431,8 @@ def get_bookmarks(db, obj_type):
     """
     Return bookmarks for given object type.
     """
-    if obj_type == "Person":
-        return db.get_bookmarks()
-    if obj_type == "Citation":
-        return db.get_citation_bookmarks()
-    if obj_type == "Event":
-        return db.get_event_bookmarks()
-    if obj_type == "Family":
-        return db.get_family_bookmarks()
-    if obj_type == "Media":
-        return db.get_media_bookmarks()
-    if obj_type == "Note":
-        return db.get_note_bookmarks()
-    if obj_type == "Place":
-        return db.get_place_bookmarks()
-    if obj_type == "Source":
-        return db.get_source_bookmarks()
-    if obj_type == "Repository":
-        return db.get_repo_bookmarks()
+    if obj_type in BOOKMARK_METHODS:
+        return getattr(db, BOOKMARK_METHODS[obj_type])()
     return []
 
 
@@ -410,19 +472,9 @@ def find_reference(obj, reference_type, reference_handle):
     """
     Find a specific reference object inside a given object.
     """
-    if reference_type == "EventRef":
-        reference_list = obj.event_ref_list
-    elif reference_type == "ChildRef":
-        reference_list = obj.child_ref_list
-    elif reference_type == "MediaRef":
-        reference_list = obj.media_list
-    elif reference_type == "PersonRef":
-        reference_list = obj.person_ref_list
-    elif reference_type == "RepoRef":
-        reference_list = obj.reporef_list
-    else:
+    if reference_type not in REFERENCE_LISTS:
         return None
-    for reference in reference_list:
+    for reference in getattr(obj, REFERENCE_LISTS[reference_type]):
         if reference.ref == reference_handle:
             return reference
     return None
@@ -457,36 +509,55 @@ def get_secondary_object_list(obj, secondary_type):
     Return list of secondary objects.
     """
     if secondary_type == "Name":
-        secondary_list = [obj.primary_name] + obj.alternate_names
-    elif secondary_type == "Attribute":
-        secondary_list = obj.attribute_list
-    elif secondary_type == "Address":
-        secondary_list = obj.address_list
-    elif secondary_type == "LdsOrd":
-        secondary_list = obj.lds_ord_list
-    elif secondary_type == "ChildRef":
-        secondary_list = obj.child_ref_list
-    elif secondary_type == "PersonRef":
-        secondary_list = obj.person_ref_list
-    elif secondary_type == "RepoRef":
-        secondary_list = obj.reporef_list
-    else:
-        return None
-    return secondary_list
+        return [obj.primary_name] + obj.alternate_names
+    if secondary_type in SECONDARY_LISTS:
+        return getattr(obj, SECONDARY_LISTS[secondary_type])
+    return None
+
+
+def get_object_hash(obj):
+    """
+    Return hash of the serialized object in digest format.
+    """
+    return blake2b(
+        str(obj.serialize()).encode("utf-8"), digest_size=16
+    ).hexdigest()
 
 
 def find_secondary_object(obj, secondary_type, secondary_hash):
     """
-    Find a specific secondary object inside a given object.
+    Find a specific secondary object inside a given object. The hashes for
+    a primary object are cached by position, a cached hit is verified
+    before use so stale entries fall back to a fresh scan.
     """
     secondary_list = get_secondary_object_list(obj, secondary_type)
-    if secondary_list:
-        for secondary_obj in secondary_list:
-            sha256_hash = hashlib.sha256()
-            sha256_hash.update(str(secondary_obj.serialize()).encode("utf-8"))
-            if sha256_hash.hexdigest() == secondary_hash:
+    if not secondary_list:
+        return None
+    handle = getattr(obj, "handle", None)
+    key = (handle, secondary_type)
+    if handle:
+        index = SECONDARY_HASHES.get(key, {}).get(secondary_hash)
+        if index is not None and index < len(secondary_list):
+            secondary_obj = secondary_list[index]
+            if get_object_hash(secondary_obj) == secondary_hash:
                 return secondary_obj
-    return None
+    hashes = {
+        get_object_hash(secondary_obj): index
+        for (index, secondary_obj) in enumerate(secondary_list)
+    }
+    if handle:
+        SECONDARY_HASHES[key] = hashes
+    index = hashes.get(secondary_hash)
+    if index is None:
+        return None
+    return secondary_list[index]
+
+
+def clear_secondary_hashes():
+    """
+    Clear the cached secondary object hashes.
+    """
+    SECONDARY_HASHES.clear()
 
 
 def find_modified_secondary_object(secondary_type, old_obj, updated_obj):
@@ -497,14 +568,16 @@ def find_modified_secondary_object(secondary_type, old_obj, updated_obj):
     """
     old_list = get_secondary_object_list(old_obj, secondary_type)
     new_list = get_secondary_object_list(updated_obj, secondary_type)
-    for obj in old_list:
-        obj_serialized = obj.serialize()
-        for new_obj in new_list:
-            if new_obj.serialize() == obj_serialized:
-                new_list.remove(new_obj)
-                break
-    if len(new_list) == 1:
-        return new_list[0]
+    old_hashes = Counter(get_object_hash(obj) for obj in old_list)
+    modified_list = []
+    for new_obj in new_list:
+        new_hash = get_object_hash(new_obj)
+        if old_hashes[new_hash]:
+            old_hashes[new_hash] -= 1
+        else:
+            modified_list.append(new_obj)
+    if len(modified_list) == 1:
+        return modified_list[0]
     return None
 
 
@@ -524,16 +597,18 @@ def set_dnd_css(row, top):
     """
     Set custom CSS for the drag and drop view.
     """
-    if top:
-        text = "top"
-    else:
-        text = "bottom"
-    css = ".frame { border-%s-width: 3px; border-%s-color: #4e9a06; }" % (
-        text,
-        text,
-    )
-    provider = Gtk.CssProvider()
-    provider.load_from_data(css.encode("utf-8"))
+    if top not in DND_PROVIDERS:
+        if top:
+            text = "top"
+        else:
+            text = "bottom"
+        css = ".frame { border-%s-width: 3px; border-%s-color: #4e9a06; }" % (
+            text,
+            text,
+        )
+        DND_PROVIDERS[top] = Gtk.CssProvider()
+        DND_PROVIDERS[top].load_from_data(css.encode("utf-8"))
+    provider = DND_PROVIDERS[top]
     context = row.get_style_context()
     context.add_provider(provider, Gtk.STYLE_PROVIDER_PRIORITY_USER)
     context.add_class("frame")
@@ -553,18 +628,14 @@ def describe_object(db, obj):
             return title.split(split_character)[1].strip()
         return title.strip()
 
-    for obj_data in GRAMPS_OBJECTS:
-        if isinstance(obj, obj_data[0]):
-            (
-                dummy_obj_class,
-                obj_type,
-                obj_lang,
-                dummy_dnd_type,
-                dummy_dnd_icon,
-            ) = obj_data
-            if not obj_lang:
-                obj_lang = obj_type
-            break
+    (
+        dummy_obj_class,
+        obj_type,
+        obj_lang,
+        dummy_dnd_type,
+        dummy_dnd_icon,
+        dummy_is_reference,
+    ) = get_object_data(obj)
     if isinstance(obj, BasicPrimaryObject):
         title, dummy_obj = navigation_label(db, obj_type, obj.handle)
         title = clean_title(title, "]")
@@ -685,6 +756,7 @@ def get_initial_object(db, obj_type=None):
     return None
 
 
+@lru_cache(maxsize=16)
 def prepare_markup(config, key="detail", scheme=0):
     """
     Prepare text markup string.
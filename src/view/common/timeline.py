@@ -66,6 +66,20 @@ EVENT_CATEGORIES = [
     "custom",
 ]
 
+EVENT_MAP = event_type.get_map()
+
+CATEGORY_EVENTS = [
+    (
+        category.lower().replace("life events", "vital"),
+        [
+            EVENT_MAP[event_id]
+            for event_id in event_ids
+            if event_id in EVENT_MAP
+        ],
+    )
+    for category, event_ids in event_type.get_menu_standard_xml()
+]
+
 
 # A timeline item is a tuple of following format:
 #
@@ -219,32 +233,21 @@ class GrampsTimeline:
         """
         Prepare an eligible event filter list.
         """
-        eligible_events = set([])
-        eligible_events.add("Birth")
-        eligible_events.add("Death")
+        eligible_events = {"Birth", "Death"}
         default_event_types = event_type.get_standard_xml()
-        default_event_map = event_type.get_map()
         custom_event_types = self.db_handle.get_event_types()
         for key in event_filters:
-            if key in default_event_types:
+            if key in default_event_types or key in custom_event_types:
                 eligible_events.add(key)
-                continue
-            if key in custom_event_types:
-                eligible_events.add(key)
-                continue
-            if key not in EVENT_CATEGORIES:
+            elif key not in EVENT_CATEGORIES:
                 raise ValueError(
                     "{} is not a valid event or event category".format(key)
                 )
-        for entry in event_type.get_menu_standard_xml():
-            event_key = entry[0].lower().replace("life events", "vital")
-            if event_key in event_filters:
-                for event_id in entry[1]:
-                    if event_id in default_event_map:
-                        eligible_events.add(default_event_map[event_id])
+        for category, event_names in CATEGORY_EVENTS:
+            if category in event_filters:
+                eligible_events.update(event_names)
         if "custom" in event_filters:
-            for event_name in custom_event_types:
-                eligible_events.add(event_name)
+            eligible_events.update(custom_event_types)
         return eligible_events
 
     def get_category(self, event):
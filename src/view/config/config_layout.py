@@ -110,7 +110,7 @@ class ProfilePageLayout(Gtk.VBox):
         """
         Render options content.
         """
-        list(map(self.remove, self.get_children()))
+        self.foreach(self.remove)
         groups = {
             "label": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
             "visible": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
@@ -179,12 +179,11 @@ class ProfilePageLayout(Gtk.VBox):
         """
         settings = self.config.get_section_settings("layout")
         prefix = obj_type.lower()
-        prefix_length = len(prefix)
-        groups = []
-        for setting in settings:
-            if setting[:prefix_length] == prefix and "visible" in setting:
-                groups.append(setting.split(".")[1])
-        return groups
+        return [
+            setting.split(".")[1]
+            for setting in settings
+            if setting.startswith(prefix) and "visible" in setting
+        ]
 
     def apply_changes(self, *_dummy_obj):
         """
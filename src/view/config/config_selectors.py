@@ -239,7 +239,7 @@ class FieldSelector(Gtk.HBox):
         """
         Load selector.
         """
-        list(map(self.remove, self.get_children()))
+        self.foreach(self.remove)
         self.obj_type = obj_type
         self.value_type = value_type
         self.value = value
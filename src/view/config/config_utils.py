@@ -204,12 +204,11 @@ class ConfigReset(Gtk.ButtonBox):
             section = self.space
             prefix = ""
         settings = self.config.get_section_settings(section)
-        prefix_length = len(prefix)
-        options = []
-        for setting in settings:
-            if setting[:prefix_length] == prefix:
-                options.append("%s.%s" % (section, setting))
-        return options
+        return [
+            "%s.%s" % (section, setting)
+            for setting in settings
+            if setting.startswith(prefix)
+        ]
 
 
 # -------------------------------------------------------------------------
@@ -494,7 +493,9 @@ def get_event_fields(grstate, key, count=12):
     prefix = "".join(("status.", key, "-"))
     for number in range(1, count):
         option = "".join((prefix, str(number)))
-        value = grstate.config.get(option).split(":")
-        if len(value) > 1:
-            events.append(value[1])
+        dummy_type, separator, value = grstate.config.get(option).partition(
+            ":"
+        )
+        if separator:
+            events.append(value)
     return events
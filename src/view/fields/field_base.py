@@ -170,22 +170,29 @@ def get_fact_field(_dummy_grstate, _dummy_obj, event_type, args):
 
 def get_attribute_field(_dummy_grstate, obj, attribute_type, args):
     """
-    Find an attribute and return field data.
+    Find an attribute and return field data. The attributes are indexed
+    by type once and the index kept in args for the remaining fields.
     """
     args = args or {}
     get_label = args.get("get_label")
     assert get_label is not None
     skip_labels = args.get("skip_labels")
-    for attribute in obj.attribute_list:
-        if (
-            attribute.get_type().xml_str() == attribute_type
-            and attribute.get_value()
-        ):
-            value = get_label(attribute.get_value())
-            if skip_labels:
-                return [(value, get_label(""))]
-            label = get_label(str(attribute.get_type()))
-            return [(label, value)]
+    attribute_cache = args.get("attribute_cache")
+    if attribute_cache is None:
+        attribute_cache = {}
+        for attribute in obj.attribute_list:
+            if attribute.get_value():
+                attribute_cache.setdefault(
+                    attribute.get_type().xml_str(), attribute
+                )
+        args["attribute_cache"] = attribute_cache
+    attribute = attribute_cache.get(attribute_type)
+    if attribute:
+        value = get_label(attribute.get_value())
+        if skip_labels:
+            return [(value, get_label(""))]
+        label = get_label(str(attribute.get_type()))
+        return [(label, value)]
     return []
 
 
@@ -28,7 +28,6 @@ Field formatting utility functions.
 #
 # ------------------------------------------------------------------------
 from gramps.gen.const import GRAMPS_LOCALE as glocale
-from gramps.gen.display.place import displayer as place_displayer
 
 # ------------------------------------------------------------------------
 #
@@ -184,11 +183,11 @@ def get_event_labels(grstate, event, args):
     else:
         description = glocale.translation.sgettext(event.type.xml_str())
     if args.get("multiple_events"):
-        description = "".join((description, " *"))
+        description = "%s *" % description
 
     date = glocale.date_displayer.display(event.date)
     if event_format in [1, 3, 5, 6]:
-        place = place_displayer.display_event(grstate.dbstate.db, event)
+        place = grstate.display_place(event)
     else:
         place = None
 
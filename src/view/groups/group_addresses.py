@@ -54,4 +54,3 @@ class AddressesCardGroup(CardGroupList):
                 address,
             )
             self.add_card(card)
-        self.show_all()
@@ -81,7 +81,6 @@ class AssociationsCardGroup(CardGroupList):
         if back_list:
             for person_handle in back_list:
                 self._add_back_person(person_handle)
-        self.show_all()
 
     def _add_back_person(self, person_handle):
         """
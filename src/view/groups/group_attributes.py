@@ -49,4 +49,3 @@ class AttributesCardGroup(CardGroupList):
         for attribute in obj.attribute_list:
             card = AttributeCard(grstate, groptions, obj, attribute)
             self.add_card(card)
-        self.show_all()
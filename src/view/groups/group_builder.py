@@ -297,7 +297,7 @@ def get_references_group(
     Get the group of objects that reference the given object.
     """
     if not obj_list:
-        obj_list = grstate.dbstate.db.find_backlink_handles(obj.handle)
+        obj_list = grstate.fetch_backlinks(obj.handle)
         if not obj_list:
             return None
 
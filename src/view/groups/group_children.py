@@ -82,7 +82,6 @@ class ChildrenCardGroup(CardGroupList):
                 child_ref,
             )
             self.add_card(profile)
-        self.show_all()
 
     def save_reordered_list(self):
         """
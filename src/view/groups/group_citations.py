@@ -74,7 +74,6 @@ class CitationsCardGroup(CardGroupList):
                     grstate, groptions, citation, reference=reference
                 )
                 self.add_card(card)
-        self.show_all()
 
     def save_new_object(self, handle, insert_row):
         """
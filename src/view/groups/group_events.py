@@ -78,7 +78,6 @@ class EventsCardGroup(CardGroupList):
                 event_ref,
             )
             self.add_card(card)
-        self.show_all()
 
     def save_reordered_list(self):
         """
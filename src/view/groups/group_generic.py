@@ -22,19 +22,12 @@
 GenericCardGroup
 """
 
-# ------------------------------------------------------------------------
-#
-# GTK Modules
-#
-# ------------------------------------------------------------------------
-from gi.repository import Gtk
-
 # ------------------------------------------------------------------------
 #
 # Plugin Modules
 #
 # ------------------------------------------------------------------------
-from ..common.common_classes import GrampsOptions
+from ..common.common_classes import GrampsOptions, create_size_groups
 from ..cards import (
     CitationCard,
     EventCard,
@@ -84,13 +77,7 @@ class GenericCardGroup(CardGroupList):
         else:
             tuple_list = [(card_obj_type, x) for x in card_obj_handles]
 
-        groups = {
-            "ref": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
-            "age": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
-            "data": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
-            "attributes": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
-            "image": Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL),
-        }
+        groups = create_size_groups()
 
         for obj_type, obj_handle in tuple_list:
             if obj_type not in CARD_MAP:
@@ -101,4 +88,3 @@ class GenericCardGroup(CardGroupList):
             obj = self.fetch(obj_type, obj_handle)
             card = CARD_MAP[obj_type](grstate, group_groptions, obj)
             self.add_card(card)
-        self.show_all()
@@ -69,7 +69,6 @@ class PaternalLineageCardGroup(CardGroupList):
 
         families, dummy_ancestors = self.extract_line(maternal=maternal)
         self.render_families(families, groptions)
-        self.show_all()
 
     def render_families(self, families, groptions):
         """
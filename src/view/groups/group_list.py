@@ -34,7 +34,7 @@ import pickle
 # GTK Modules
 #
 # ------------------------------------------------------------------------
-from gi.repository import Gdk, Gtk
+from gi.repository import Gdk, GLib, Gtk
 
 # ------------------------------------------------------------------------
 #
@@ -45,6 +45,8 @@ from ..common.common_classes import GrampsConfig, GrampsObject
 from ..common.common_utils import set_dnd_css
 from ..cards.card_object import ObjectCard
 
+CARD_BATCH_SIZE = 10
+
 
 # ------------------------------------------------------------------------
 #
@@ -68,6 +70,8 @@ class CardGroupList(Gtk.ListBox, GrampsConfig):
         self.row_current = 0
         self.row_previous_provider = None
         self.row_current_provider = None
+        self.deferred_cards = []
+        self.deferred_source_id = None
         if enable_drop:
             self.connect("drag-data-received", self.on_drag_data_received)
             self.connect("drag-motion", self.on_drag_motion)
@@ -91,6 +95,68 @@ class CardGroupList(Gtk.ListBox, GrampsConfig):
         row.add(self.row_cards[-1])
         self.add(row)
 
+    def add_cards(self, cards):
+        """
+        Add a list of Card objects as one batch.
+        """
+        self.freeze_child_notify()
+        try:
+            for card in cards:
+                self.add_card(card)
+        finally:
+            self.thaw_child_notify()
+
+    def add_cards_deferred(self, card_builder, obj_list):
+        """
+        Add cards for a list of objects. The first batch is built right away
+        and the remainder in idle time so large groups do not block the page
+        from being displayed.
+        """
+        self.add_cards(
+            [card_builder(obj) for obj in obj_list[:CARD_BATCH_SIZE]]
+        )
+        self.deferred_cards = [
+            (card_builder, obj) for obj in obj_list[CARD_BATCH_SIZE:]
+        ]
+        if self.deferred_cards:
+            self.deferred_source_id = GLib.idle_add(
+                self.__add_deferred_cards, priority=GLib.PRIORITY_LOW
+            )
+            self.connect("destroy", self.__cancel_deferred_cards)
+
+    def __add_deferred_cards(self):
+        """
+        Build and add the next batch of deferred cards.
+        """
+        if not self.get_toplevel().is_toplevel():
+            self.__cancel_deferred_cards()
+            return False
+        batch = self.deferred_cards[:CARD_BATCH_SIZE]
+        del self.deferred_cards[:CARD_BATCH_SIZE]
+        cards = [card_builder(obj) for (card_builder, obj) in batch]
+        self.add_cards(cards)
+        for card in cards:
+            card.get_parent().show_all()
+        if self.deferred_cards:
+            return True
+        self.deferred_source_id = None
+        return False
+
+    def __cancel_deferred_cards(self, *_dummy_args):
+        """
+        Drop any cards not yet built.
+        """
+        if self.deferred_source_id:
+            GLib.source_remove(self.deferred_source_id)
+            self.deferred_source_id = None
+        self.deferred_cards = []
+
+    def __len__(self):
+        """
+        Return number of cards, including those not yet built.
+        """
+        return len(self.row_cards) + len(self.deferred_cards)
+
     def on_drag_data_received(
         self,
         _dummy_widget,
@@ -178,8 +244,8 @@ class CardGroupList(Gtk.ListBox, GrampsConfig):
         else:
             self.row_previous = current_row.get_index()
             self.row_current = self.row_previous + 1
-            if self.row_current >= len(self) - 1:
-                self.row_current = len(self) - 1
+            if self.row_current >= len(self.row_cards) - 1:
+                self.row_current = len(self.row_cards) - 1
 
         if self.row_current == 0 and self.row_previous == 0:
             self.row_current_provider = set_dnd_css(
@@ -108,7 +108,6 @@ class MediaCardGroup(CardGroupList):
                     grstate, groptions, self.group_base.obj, media_ref
                 )
                 self.add_card(card)
-        self.show_all()
 
     def save_reordered_list(self):
         """
@@ -57,4 +57,3 @@ class NamesCardGroup(CardGroupList):
         for name in obj.alternate_names:
             card = NameCard(grstate, groptions, obj, name)
             self.add_card(card)
-        self.show_all()
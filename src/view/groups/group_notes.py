@@ -73,7 +73,6 @@ class NotesCardGroup(CardGroupList):
             card = NoteCard(grstate, groptions, note, reference=obj_lang)
             card.set_size_request(220, -1)
             self.add_card(card)
-        self.show_all()
 
     def get_child_object_notes(self, notes):
         """
@@ -46,7 +46,9 @@ class LDSOrdinancesCardGroup(CardGroupList):
         CardGroupList.__init__(
             self, grstate, groptions, obj, enable_drop=False
         )
-        for ordinance in obj.lds_ord_list:
-            card = LDSOrdinanceCard(grstate, groptions, obj, ordinance)
-            self.add_card(card)
-        self.show_all()
+        self.add_cards_deferred(
+            lambda ordinance: LDSOrdinanceCard(
+                grstate, groptions, obj, ordinance
+            ),
+            obj.lds_ord_list,
+        )
@@ -65,7 +65,6 @@ class EnclosingPlacesCardGroup(CardGroupList):
                 grstate, groptions, list_place, list_place_ref
             )
             self.add_card(profile)
-        self.show_all()
 
     def build_enclosing_place_list(self, place_list, handle):
         """
@@ -114,7 +113,6 @@ class EnclosedPlacesCardGroup(CardGroupList):
                 grstate, groptions, list_place, list_place_ref
             )
             self.add_card(profile)
-        self.show_all()
 
     def build_enclosed_place_list(self, place_list, handle, recurse=False):
         """
@@ -61,4 +61,3 @@ class RepositoriesCardGroup(CardGroupList):
         for repo_ref in obj.reporef_list:
             profile = RepositoryRefCard(grstate, groptions, obj, repo_ref)
             self.add_card(profile)
-        self.show_all()
@@ -57,25 +57,20 @@ class SourcesCardGroup(CardGroupList):
         )
         sources_list = []
         if self.group_base.obj_type == "Repository":
-            for (
-                obj_type,
-                obj_handle,
-            ) in grstate.dbstate.db.find_backlink_handles(
-                self.group_base.obj.handle
-            ):
-                if obj_type == "Source":
-                    source = self.fetch("Source", obj_handle)
-                    sources_list.append(source)
-
-        maximum = grstate.config.get("group.source.max-per-group")
-        sources_list = sources_list[:maximum]
-
-        if sources_list:
-            for source in sources_list:
-                card = SourceCard(
-                    grstate,
-                    groptions,
-                    source,
+            maximum = grstate.config.get("group.source.max-per-group")
+            source_handles = [
+                obj_handle
+                for (obj_type, obj_handle) in grstate.fetch_backlinks(
+                    self.group_base.obj.handle
                 )
-                self.add_card(card)
-        self.show_all()
+                if obj_type == "Source"
+            ]
+            sources_list = [
+                self.fetch("Source", handle)
+                for handle in source_handles[:maximum]
+            ]
+
+        self.add_cards_deferred(
+            lambda source: SourceCard(grstate, groptions, source),
+            sources_list,
+        )
@@ -47,6 +47,17 @@ from .group_list import CardGroupList
 
 _ = glocale.translation.sgettext
 
+CATEGORY_OPTIONS = [
+    (category, "show-class-%s" % category) for category in EVENT_CATEGORIES
+]
+RELATION_CATEGORY_OPTIONS = [
+    (category, "show-family-class-%s" % category)
+    for category in EVENT_CATEGORIES
+]
+RELATION_OPTIONS = [
+    (relation, "show-family-%s" % relation) for relation in RELATIVES
+]
+
 
 # ------------------------------------------------------------------------
 #
@@ -94,6 +105,7 @@ class TimelineCardGroup(CardGroupList):
             self.timeline.set_place(obj.handle)
 
         timeline = self.prepare_timeline(obj)
+        self.prefetch_citations(timeline)
         for (dummy_sortval, timeline_obj_type, timeline_obj, item) in timeline:
             if timeline_obj_type == "event":
                 (
@@ -153,27 +165,42 @@ class TimelineCardGroup(CardGroupList):
                         item,
                     )
                 )
-        self.show_all()
+
+    def prefetch_citations(self, timeline):
+        """
+        Load quality data for all event citations in one pass so the cards
+        need not each go back to the database.
+        """
+        citation_handles = set()
+        for (dummy_sortval, timeline_obj_type, dummy_obj, item) in timeline:
+            if timeline_obj_type == "event":
+                citation_handles.update(item[0].citation_list)
+        self.grstate.prefetch_citations(citation_handles)
 
     def prepare_options(self):
         """
         Parse and prepare filter groups and options.
         """
-        for category in EVENT_CATEGORIES:
-            if self.get_option("show-class-%s" % category):
-                self.options["categories"].append(category)
-            if self.group_base.obj_type == "Person" and self.get_option(
-                "show-family-class-%s" % category
-            ):
-                self.options["relation_categories"].append(category)
-
-        if self.group_base.obj_type == "Person":
-            for relation in RELATIVES:
-                if self.get_option("show-family-%s" % relation):
-                    self.options["relations"].append(relation)
-
-        self.options["ancestors"] = self.get_option("generations-ancestors")
-        self.options["offspring"] = self.get_option("generations-offspring")
+        get_option = self.get_option
+        is_person = self.group_base.obj_type == "Person"
+        self.options["categories"] = [
+            category
+            for (category, option) in CATEGORY_OPTIONS
+            if get_option(option)
+        ]
+        if is_person:
+            self.options["relation_categories"] = [
+                category
+                for (category, option) in RELATION_CATEGORY_OPTIONS
+                if get_option(option)
+            ]
+            self.options["relations"] = [
+                relation
+                for (relation, option) in RELATION_OPTIONS
+                if get_option(option)
+            ]
+        self.options["ancestors"] = get_option("generations-ancestors")
+        self.options["offspring"] = get_option("generations-offspring")
 
     def prepare_timeline(self, obj):
         """
@@ -183,16 +210,20 @@ class TimelineCardGroup(CardGroupList):
         for (sortval, item) in self.timeline.events(raw=True):
             timeline.append((sortval, "event", None, item))
 
-        if (
+        option = "%s.show-age" % self.groptions.option_space
+        if self.grstate.config.is_set(option):
+            show_age = self.get_option("show-age")
+        else:
+            show_age = self.grstate.config.get("timeline.person.show-age")
+        if not show_age:
+            self.groptions.set_age_base(None)
+        elif (
             not self.groptions.age_base
             and self.group_base.obj_type == "Person"
-            and self.get_option("show-age")
         ):
             birth_ref = obj.get_birth_ref()
             if birth_ref:
-                event = self.grstate.dbstate.db.get_event_from_handle(
-                    birth_ref.ref
-                )
+                event = self.fetch("Event", birth_ref.ref)
                 if event:
                     self.groptions.set_age_base(event.get_date_object())
 
@@ -63,7 +63,6 @@ class UncitedEventsCardGroup(CardGroupList):
         if self.group_base.obj_type == "Person":
             for family_handle in obj.family_list:
                 self.check_family(groptions, family_handle)
-        self.show_all()
 
     def check_events(self, options, obj):
         """
@@ -57,7 +57,6 @@ class UrlsCardGroup(CardGroupList):
         self.parse_urls()
         if self.grstate.config.get("general.include-note-urls"):
             self.parse_notes()
-        self.show_all()
 
     def parse_urls(self):
         """
@@ -71,7 +71,7 @@ class CardGroupWindow(ManagedWindow):
         self.group_base = GrampsObject(obj)
         self.group_type = group_type
         working_title = self.build_title(title)
-        if "Ref" in self.group_base.obj_type:
+        if self.group_base.is_reference:
             self.base_title = "%s %s: %s" % (
                 working_title,
                 _("Reference"),
@@ -86,9 +86,11 @@ class CardGroupWindow(ManagedWindow):
         ManagedWindow.__init__(self, grstate.uistate, [], obj)
 
         group_args = {"raw": True, "title": self.base_title}
-        group = group_builder(grstate, group_type, obj, group_args)
+        self.group = group_builder(grstate, group_type, obj, group_args)
         self.group_box = Gtk.VBox(spacing=3, margin=3)
-        self.group_box.pack_start(group, expand=False, fill=True, padding=0)
+        self.group_box.pack_start(
+            self.group, expand=False, fill=True, padding=0
+        )
         scroll = make_scrollable(self.group_box)
 
         window = Gtk.Window(type=Gtk.WindowType.TOPLEVEL)
@@ -137,8 +139,12 @@ class CardGroupWindow(ManagedWindow):
         group = group_builder(
             self.grstate, self.group_type, self.group_base.obj, group_args
         )
-        list(map(self.group_box.remove, self.group_box.get_children()))
-        self.group_box.pack_start(group, expand=False, fill=True, padding=0)
+        if self.group:
+            self.group.destroy()
+        self.group = group
+        self.group_box.pack_start(
+            self.group, expand=False, fill=True, padding=0
+        )
         self.show()
 
     def reload(self, obj, group_type=None):
@@ -77,6 +77,26 @@ def submenu_item(icon, label, menu):
     return item
 
 
+def lazy_submenu_item(icon, label, populate, *args):
+    """
+    Helper for constructing a submenu item whose menu is only populated
+    when the item is first selected.
+    """
+    item = submenu_item(icon, label, Gtk.Menu())
+    item.connect("select", populate_submenu, populate, args)
+    return item
+
+
+def populate_submenu(item, populate, args):
+    """
+    Populate a lazy submenu if not already done.
+    """
+    menu = item.get_submenu()
+    if not menu.get_children():
+        populate(menu, *args)
+        menu.show_all()
+
+
 def new_menu(icon, label, callback, *args):
     """
     Create and return a new menu with an initial entry.
@@ -172,8 +192,27 @@ def add_attributes_menu(grstate, parent_menu, grobject, grchild=None):
     target_object = grchild or grobject
     if not target_object.has_attributes:
         return
+    parent_menu.append(
+        lazy_submenu_item(
+            "gramps-attribute",
+            _("Attributes"),
+            build_attributes_menu,
+            grstate,
+            grobject,
+            grchild,
+        )
+    )
+
+
+def build_attributes_menu(menu, grstate, grobject, grchild):
+    """
+    Populate the attributes submenu.
+    """
+    target_object = grchild or grobject
     action = action_handler("Attribute", grstate, None, grobject, grchild)
-    menu = new_menu("list-add", _("Add a new attribute"), action.add_attribute)
+    menu.add(
+        menu_item("list-add", _("Add a new attribute"), action.add_attribute)
+    )
     attribute_list = target_object.obj.attribute_list
     if attribute_list:
         deletemenu = new_submenu(
@@ -204,7 +243,6 @@ def add_attributes_menu(grstate, parent_menu, grobject, grchild=None):
                     action.edit_attribute,
                 )
             )
-    parent_menu.append(submenu_item("gramps-attribute", _("Attributes"), menu))
 
 
 def add_citations_menu(grstate, parent_menu, grobject, grchild=None):
@@ -216,13 +254,32 @@ def add_citations_menu(grstate, parent_menu, grobject, grchild=None):
     target_object = grchild or grobject
     if not target_object.has_citations:
         return
+    parent_menu.append(
+        lazy_submenu_item(
+            "gramps-citation",
+            _("Citations"),
+            build_citations_menu,
+            grstate,
+            grobject,
+            grchild,
+        )
+    )
+
+
+def build_citations_menu(menu, grstate, grobject, grchild):
+    """
+    Populate the citations submenu.
+    """
+    target_object = grchild or grobject
     db = grstate.dbstate.db
     delete_enabled = grstate.config.get(OPTION_DELETE_SUBMENUS)
     action = action_handler("Citation", grstate, None, grobject, grchild)
-    menu = new_menu(
-        "list-add",
-        _("Add new citation for a new source"),
-        action.add_new_source_citation,
+    menu.add(
+        menu_item(
+            "list-add",
+            _("Add new citation for a new source"),
+            action.add_new_source_citation,
+        )
     )
     menu.add(
         menu_item(
@@ -267,7 +324,6 @@ def add_citations_menu(grstate, parent_menu, grobject, grchild=None):
                     menu_item("list-remove", text, action.delete_object)
                 )
             menu.add(menu_item("gtk-edit", text, action.edit_citation))
-    parent_menu.append(submenu_item("gramps-citation", _("Citations"), menu))
 
 
 def add_zotero_option(grstate, menu, action):
@@ -303,9 +359,26 @@ def add_notes_menu(grstate, parent_menu, grobject, grchild=None):
     target_object = grchild or grobject
     if not target_object.has_notes:
         return
+    parent_menu.append(
+        lazy_submenu_item(
+            "gramps-notes",
+            _("Notes"),
+            build_notes_menu,
+            grstate,
+            grobject,
+            grchild,
+        )
+    )
+
+
+def build_notes_menu(menu, grstate, grobject, grchild):
+    """
+    Populate the notes submenu.
+    """
+    target_object = grchild or grobject
     delete_enabled = grstate.config.get(OPTION_DELETE_SUBMENUS)
     action = action_handler("Note", grstate, None, grobject, grchild)
-    menu = new_menu("list-add", _("Add a new note"), action.add_new_note)
+    menu.add(menu_item("list-add", _("Add a new note"), action.add_new_note))
     menu.add(
         menu_item(
             "list-add", _("Add an existing note"), action.add_existing_note
@@ -328,7 +401,6 @@ def add_notes_menu(grstate, parent_menu, grobject, grchild=None):
             menu.add(menu_item("gtk-edit", text, action.edit_note))
     if grstate.config.get("menu.notes-children") and not grchild:
         get_child_notes(menu, grstate, grobject, grchild)
-    parent_menu.append(submenu_item("gramps-notes", _("Notes"), menu))
 
 
 def get_child_notes(menu, grstate, grobject, grchild):
@@ -422,16 +494,29 @@ def add_tags_menu(grstate, parent_menu, grobject, sort_by_name=False):
         return
     if not grobject.has_tags:
         return
+    parent_menu.append(
+        lazy_submenu_item(
+            "gramps-tag",
+            _("Tags"),
+            build_tags_menu,
+            grstate,
+            grobject,
+            sort_by_name,
+        )
+    )
+
+
+def build_tags_menu(menu, grstate, grobject, sort_by_name):
+    """
+    Populate the tags submenu.
+    """
     delete_enabled = grstate.config.get(OPTION_DELETE_SUBMENUS)
-    menu = Gtk.Menu()
-    tag_list = grobject.obj.tag_list
+    tag_list = set(grobject.obj.tag_list)
     tag_add_list = []
     tag_remove_list = []
     tag_delete_list = []
-    db = grstate.dbstate.db
-    for tag_handle in db.get_tag_handles():
-        tag = db.get_tag_from_handle(tag_handle)
-        if tag_handle in tag_list:
+    for tag in grstate.dbstate.db.iter_tags():
+        if tag.handle in tag_list:
             tag_remove_list.append(tag)
         else:
             tag_add_list.append(tag)
@@ -452,7 +537,6 @@ def add_tags_menu(grstate, parent_menu, grobject, sort_by_name=False):
     action = action_handler("Tag", grstate, None, grobject)
     menu.add(menu_item("gramps-tag", _("Add new tag"), action.add_new_tag))
     menu.add(menu_item("gramps-tag", _("Organize tags"), action.organize_tags))
-    parent_menu.append(submenu_item("gramps-tag", _("Tags"), menu))
 
 
 def prepare_tag_menu_item(grstate, parent_menu, grobject, tag_list, icon_name):
@@ -488,8 +572,19 @@ def add_urls_menu(grstate, parent_menu, grobject):
         return
     if not grobject.has_urls:
         return
+    parent_menu.append(
+        lazy_submenu_item(
+            "gramps-url", _("Urls"), build_urls_menu, grstate, grobject
+        )
+    )
+
+
+def build_urls_menu(menu, grstate, grobject):
+    """
+    Populate the urls submenu.
+    """
     action = action_handler("Url", grstate, None, grobject)
-    menu = new_menu("list-add", _("Add a url"), action.add_url)
+    menu.add(menu_item("list-add", _("Add a url"), action.add_url))
     url_list = grobject.obj.urls
     if url_list:
         editmenu = new_submenu(menu, "gramps-url", _("Edit a url"))
@@ -509,7 +604,6 @@ def add_urls_menu(grstate, parent_menu, grobject):
                 menu_item("list-remove", text, action.delete_object)
             )
             menu.add(menu_item("gramps-url", text, action.launch_url))
-    parent_menu.append(submenu_item("gramps-url", _("Urls"), menu))
 
 
 def add_media_menu(grstate, parent_menu, grobject):
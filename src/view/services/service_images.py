@@ -27,8 +27,16 @@ ImagesService
 # Python Modules
 #
 # -------------------------------------------------------------------------
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
+# -------------------------------------------------------------------------
+#
+# GTK Modules
+#
+# -------------------------------------------------------------------------
+from gi.repository import GLib
+
 # -------------------------------------------------------------------------
 #
 # Gramps Modules
@@ -36,6 +44,8 @@ from functools import lru_cache
 # -------------------------------------------------------------------------
 from gramps.gen.utils.thumbnails import get_thumbnail_image
 
+THUMBNAIL_WORKERS = 4
+
 
 # -------------------------------------------------------------------------
 #
@@ -53,15 +63,36 @@ class ImagesService:
         """
         if not hasattr(cls, "instance"):
             cls.instance = super(ImagesService, cls).__new__(cls)
+            cls.instance.executor = ThreadPoolExecutor(
+                max_workers=THUMBNAIL_WORKERS
+            )
         return cls.instance
 
-    @lru_cache(maxsize=64)
+    @lru_cache(maxsize=256)
     def get_thumbnail_image(self, path, rectangle, size):
         """
         Fetch a thumbnail.
         """
         return get_thumbnail_image(path, rectangle=rectangle, size=size)
 
+    def queue_thumbnail_image(self, path, rectangle, size, callback):
+        """
+        Fetch a thumbnail in a worker thread and pass the pixbuf to the
+        callback from the main loop.
+        """
+
+        def thumbnail_ready(future):
+            """
+            Hand off the finished thumbnail, if there is one.
+            """
+            if not future.exception():
+                GLib.idle_add(callback, future.result())
+
+        future = self.executor.submit(
+            self.get_thumbnail_image, path, rectangle, size
+        )
+        future.add_done_callback(thumbnail_ready)
+
     def get_cache_info(self):
         """
         Return cache info.
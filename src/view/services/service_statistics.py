@@ -156,9 +156,7 @@ class StatisticsService(Callback):
         Determine based on size what method to try to use.
         """
         if self.dbstate.is_open():
-            total, dummy_obj_list = get_object_list(
-                self.dbstate.db.get_dbname()
-            )
+            total, dummy_obj_list = get_object_list(self.dbstate.db)
             if total > self.threshold:
                 return True
         return False
@@ -29,19 +29,22 @@ Statistics service worker
 # Python Modules
 #
 # -------------------------------------------------------------------------
-import io
 import os
 import sys
 import time
 import pickle
 import argparse
-from multiprocessing import Process, Queue
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from multiprocessing import Process, SimpleQueue
 
 # -------------------------------------------------------------------------
 #
 # Gramps Modules
 #
 # -------------------------------------------------------------------------
+from gramps.gen.config import config
 from gramps.gen.datehandler import get_date
 from gramps.gen.db import DBLOCKFN, DBMODE_R
 from gramps.gen.db.utils import (
@@ -50,38 +53,31 @@ from gramps.gen.db.utils import (
     write_lock_file,
 )
 from gramps.gen.lib import Citation, Person, EventType, EventRoleType
+from gramps.gen.lib.date import Today
 from gramps.gen.utils.alive import probably_alive
 from gramps.gen.utils.file import media_path_full
 
+BAPTISM_TYPES = (EventType.BAPTISM, EventType.CHRISTEN)
+BURIAL_TYPES = (EventType.BURIAL, EventType.CREMATION)
+DEATH_TYPES = (EventType.CAUSE_DEATH, EventType.PROBATE)
+GENDER_PREFIX = {Person.MALE: "male", Person.FEMALE: "female"}
+(TOTAL, PRIVATE, TAGGED, UNCITED, LIVING, LIVING_NOT_PRIVATE) = range(6)
+GENDER_FIELDS = 6
+FILE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-def examine_people(args, queue=None, thread_event=None):
+
+def examine_people(db, args, queue=None, thread_event=None):
     """
     Parse and analyze people.
     """
-
-    def get_gender_stats(gender_stats, gender):
-        """
-        Return gender statistics.
-        """
-        if gender not in gender_stats:
-            gender_stats[gender] = {
-                "total": 0,
-                "private": 0,
-                "tagged": 0,
-                "uncited": 0,
-                "living": 0,
-                "living_not_private": 0,
-            }
-        return gender_stats[gender]
-
-    gender_stats = {}
+    gender_stats = defaultdict(lambda: [0] * GENDER_FIELDS)
     media, media_refs, missing_region = 0, 0, 0
     incomplete_names, alternate_names, no_families, total_living = 0, 0, 0, 0
     names_private, names_uncited = 0, 0
-    association_types = {}
+    association_types = defaultdict(int)
     association, association_refs = 0, 0
     association_private, association_uncited = 0, 0
-    participant_roles = {}
+    participant_roles = defaultdict(int)
     participant, participant_refs, participant_private = 0, 0, 0
     ldsord_people, ldsord_refs, ldsord_private, ldsord_uncited = 0, 0, 0, 0
     no_temple, no_status, no_date, no_place, no_family = 0, 0, 0, 0, 0
@@ -95,50 +91,56 @@ def examine_people(args, queue=None, thread_event=None):
     no_burial, no_burial_date, no_burial_place = 0, 0, 0
     burials_private = 0
 
-    db = open_readonly_database(args.get("tree_name"))
     total_people = db.get_number_of_people()
     all_events = args.get("all_events")
+    events = {event.handle: event for event in db.iter_events()}
+    alive_args = {
+        "current_date": Today(),
+        "max_sib_age_diff": config.get("behavior.max-sib-age-diff"),
+        "max_age_prob_alive": config.get("behavior.max-age-prob-alive"),
+        "avg_generation_gap": config.get("behavior.avg-generation-gap"),
+    }
 
     for person in db.iter_people():
         if thread_event and thread_event.is_set():
             break
 
-        length = len(person.media_list)
-        if length > 0:
+        media_list = person.media_list
+        if media_list:
             media += 1
-            media_refs += length
-            for media_ref in person.media_list:
+            media_refs += len(media_list)
+            for media_ref in media_list:
                 if not media_ref.rect:
                     missing_region += 1
 
         if person.alternate_names:
             alternate_names += 1
-        for name in [person.primary_name] + person.alternate_names:
+        for name in chain((person.primary_name,), person.alternate_names):
             if name.private:
                 names_private += 1
             if not name.citation_list:
                 names_uncited += 1
-            if name.first_name.strip() == "":
+            if (
+                not name.first_name
+                or name.first_name.isspace()
+                or not any(
+                    surname.surname and not surname.surname.isspace()
+                    for surname in name.surname_list
+                )
+            ):
                 incomplete_names += 1
-            else:
-                if name.get_surname_list():
-                    for surname in name.get_surname_list():
-                        if surname.get_surname().strip() == "":
-                            incomplete_names += 1
-                else:
-                    incomplete_names += 1
 
         if not person.parent_family_list and not person.family_list:
             no_families += 1
 
-        gender = get_gender_stats(gender_stats, person.get_gender())
-        gender["total"] += 1
+        gender = gender_stats[person.gender]
+        gender[TOTAL] += 1
         if person.private:
-            gender["private"] += 1
+            gender[PRIVATE] += 1
         if person.tag_list:
-            gender["tagged"] += 1
+            gender[TAGGED] += 1
         if not person.citation_list:
-            gender["uncited"] += 1
+            gender[UNCITED] += 1
 
         living = True
         birth_ref = person.get_birth_ref()
@@ -153,14 +155,12 @@ def examine_people(args, queue=None, thread_event=None):
                     participant_refs += 1
                     role = event_ref.get_role()
                     role_key = role.serialize()
-                    if role_key not in participant_roles:
-                        participant_roles[role_key] = 0
                     participant_roles[role_key] += 1
                     if event_ref.private:
                         participant_private += 1
 
                     if role == EventRoleType.PRIMARY:
-                        event = db.get_event_from_handle(event_ref.ref)
+                        event = events[event_ref.ref]
                         if birth_ref and event.handle == birth_ref.ref:
                             has_birth = True
                             birth_ref = None
@@ -187,10 +187,7 @@ def examine_people(args, queue=None, thread_event=None):
                             living = False
                             continue
                         event_type = event.get_type()
-                        if event_type in [
-                            EventType.BAPTISM,
-                            EventType.CHRISTEN,
-                        ]:
+                        if event_type in BAPTISM_TYPES:
                             has_baptism = True
                             if not get_date(event):
                                 no_baptism_date += 1
@@ -199,10 +196,7 @@ def examine_people(args, queue=None, thread_event=None):
                             if event.private:
                                 baptisms_private += 1
                             continue
-                        if event_type in [
-                            EventType.BURIAL,
-                            EventType.CREMATION,
-                        ]:
+                        if event_type in BURIAL_TYPES:
                             has_burial = True
                             if not get_date(event):
                                 no_burial_date += 1
@@ -212,14 +206,11 @@ def examine_people(args, queue=None, thread_event=None):
                                 burials_private += 1
                             living = False
                             continue
-                        if event_type in [
-                            EventType.CAUSE_DEATH,
-                            EventType.PROBATE,
-                        ]:
+                        if event_type in DEATH_TYPES:
                             living = False
             else:
                 if birth_ref:
-                    event = db.get_event_from_handle(birth_ref.ref)
+                    event = events[birth_ref.ref]
                     has_birth = True
                     if not get_date(event):
                         no_birth_date += 1
@@ -230,7 +221,7 @@ def examine_people(args, queue=None, thread_event=None):
                     if event.private:
                         births_private += 1
                 if death_ref:
-                    event = db.get_event_from_handle(death_ref.ref)
+                    event = events[death_ref.ref]
                     has_death = True
                     if not get_date(event):
                         no_death_date += 1
@@ -248,13 +239,13 @@ def examine_people(args, queue=None, thread_event=None):
             no_baptism += 1
 
         if living:
-            if not probably_alive(person, db):
+            if not probably_alive(person, db, **alive_args):
                 living = False
             else:
                 total_living += 1
-                gender["living"] += 1
+                gender[LIVING] += 1
                 if not person.private:
-                    gender["living_not_private"] += 1
+                    gender[LIVING_NOT_PRIVATE] += 1
 
         if not living:
             if not has_death:
@@ -270,8 +261,6 @@ def examine_people(args, queue=None, thread_event=None):
                     association_private += 1
                 if not person_ref.citation_list:
                     association_uncited += 1
-                if person_ref.rel not in association_types:
-                    association_types[person_ref.rel] = 0
                 association_types[person_ref.rel] += 1
 
         if person.lds_ord_list:
@@ -292,12 +281,15 @@ def examine_people(args, queue=None, thread_event=None):
                     no_temple += 1
                 if not ldsord.status:
                     no_status += 1
-    close_readonly_database(db)
 
-    for key in participant_roles:
-        participant_roles[key] = (participant_roles[key], participant_refs)
-    for key in association_types:
-        association_types[key] = (association_types[key], association_refs)
+    participant_roles = {
+        key: (value, participant_refs)
+        for (key, value) in participant_roles.items()
+    }
+    association_types = {
+        key: (value, association_refs)
+        for (key, value) in association_types.items()
+    }
 
     with_birth = total_people - no_birth
     with_baptism = total_people - no_baptism
@@ -368,49 +360,39 @@ def examine_people(args, queue=None, thread_event=None):
         "tag": {},
     }
 
-    for gender in gender_stats:
-        if gender == Person.MALE:
-            prefix = "male"
-        elif gender == Person.FEMALE:
-            prefix = "female"
-        else:
-            prefix = "unknown"
-        data = gender_stats[gender]
-        total_gender = data["total"]
-        payload["person"].update(
-            {
-                "%s_total" % prefix: (total_gender, total_people),
-                "%s_living" % prefix: (data["living"], total_gender),
-            }
-        )
-        payload["tag"].update({prefix: (data["tagged"], total_gender)})
-        payload["uncited"].update({prefix: (data["uncited"], total_gender)})
-        payload["privacy"].update(
-            {
-                prefix: (data["private"], total_gender),
-                "%s_living_not_private"
-                % prefix: (data["living_not_private"], data["living"]),
-            }
+    for (gender, data) in gender_stats.items():
+        prefix = GENDER_PREFIX.get(gender, "unknown")
+        total_gender = data[TOTAL]
+        person = payload["person"]
+        person["%s_total" % prefix] = (total_gender, total_people)
+        person["%s_living" % prefix] = (data[LIVING], total_gender)
+        payload["tag"][prefix] = (data[TAGGED], total_gender)
+        payload["uncited"][prefix] = (data[UNCITED], total_gender)
+        privacy = payload["privacy"]
+        privacy[prefix] = (data[PRIVATE], total_gender)
+        privacy["%s_living_not_private" % prefix] = (
+            data[LIVING_NOT_PRIVATE],
+            data[LIVING],
         )
     return post_processing(args, "People", total_people, queue, payload)
 
 
-def examine_families(args, queue=None, thread_event=None):
+def examine_families(db, args, queue=None, thread_event=None):
     """
     Parse and analyze families.
     """
     media, media_refs = 0, 0
     missing_one, missing_both = 0, 0
-    family_relations = {}
+    family_relations = defaultdict(int)
     uncited, no_events, private, tagged = 0, 0, 0, 0
     child, no_child, child_private, child_uncited = 0, 0, 0, 0
-    child_mother_relations, child_father_relations = {}, {}
+    child_mother_relations = defaultdict(int)
+    child_father_relations = defaultdict(int)
     ldsord_families, ldsord_refs, ldsord_private, ldsord_uncited = 0, 0, 0, 0
     no_temple, no_status, no_date, no_place = 0, 0, 0, 0
-    participant_roles = {}
+    participant_roles = defaultdict(int)
     participant, participant_refs, participant_private = 0, 0, 0
 
-    db = open_readonly_database(args.get("tree_name"))
     total_families = db.get_number_of_families()
     total_surnames = len(set(db.surname_list))
 
@@ -429,8 +411,6 @@ def examine_families(args, queue=None, thread_event=None):
             missing_one += 1
 
         family_type = family.type.serialize()
-        if family_type not in family_relations:
-            family_relations[family_type] = 0
         family_relations[family_type] += 1
 
         if not family.citation_list:
@@ -447,8 +427,6 @@ def examine_families(args, queue=None, thread_event=None):
             for event_ref in family.event_ref_list:
                 participant_refs += 1
                 role = event_ref.get_role().serialize()
-                if role not in participant_roles:
-                    participant_roles[role] = 0
                 participant_roles[role] += 1
                 if event_ref.private:
                     participant_private += 1
@@ -463,12 +441,8 @@ def examine_families(args, queue=None, thread_event=None):
                 if not child_ref.citation_list:
                     child_uncited += 1
                 mother_relation = child_ref.mrel.serialize()
-                if mother_relation not in child_mother_relations:
-                    child_mother_relations[mother_relation] = 0
                 child_mother_relations[mother_relation] += 1
                 father_relation = child_ref.frel.serialize()
-                if father_relation not in child_father_relations:
-                    child_father_relations[father_relation] = 0
                 child_father_relations[father_relation] += 1
 
         if family.lds_ord_list:
@@ -487,16 +461,21 @@ def examine_families(args, queue=None, thread_event=None):
                     no_temple += 1
                 if not ldsord.status:
                     no_status += 1
-    close_readonly_database(db)
 
-    for key in family_relations:
-        family_relations[key] = (family_relations[key], total_families)
-    for key in child_mother_relations:
-        child_mother_relations[key] = (child_mother_relations[key], child)
-    for key in child_father_relations:
-        child_father_relations[key] = (child_father_relations[key], child)
-    for key in participant_roles:
-        participant_roles[key] = (participant_roles[key], participant_refs)
+    family_relations = {
+        key: (value, total_families)
+        for (key, value) in family_relations.items()
+    }
+    child_mother_relations = {
+        key: (value, child) for (key, value) in child_mother_relations.items()
+    }
+    child_father_relations = {
+        key: (value, child) for (key, value) in child_father_relations.items()
+    }
+    participant_roles = {
+        key: (value, participant_refs)
+        for (key, value) in participant_roles.items()
+    }
 
     payload = {
         "family": {
@@ -548,18 +527,17 @@ def examine_families(args, queue=None, thread_event=None):
     return post_processing(args, "Families", total_families, queue, payload)
 
 
-def examine_events(args, queue=None, thread_event=None):
+def examine_events(db, args, queue=None, thread_event=None):
     """
     Parse and analyze events.
     """
     media, media_refs = 0, 0
     no_date, no_place, no_description = 0, 0, 0
     uncited, private, tagged, marriages = 0, 0, 0, 0
-    event_types = {}
-    uncited_events = {}
+    event_types = defaultdict(int)
+    uncited_events = defaultdict(int)
     no_marriage_date, no_marriage_place, marriage_private = 0, 0, 0
 
-    db = open_readonly_database(args.get("tree_name"))
     total_events = db.get_number_of_events()
 
     for event in db.iter_events():
@@ -595,18 +573,17 @@ def examine_events(args, queue=None, thread_event=None):
                 marriage_private += 1
 
         event_key = event_type.serialize()
-        if event_key not in event_types:
-            event_types[event_key] = 0
-            uncited_events[event_key] = 0
         event_types[event_key] += 1
         if not event.citation_list:
             uncited_events[event_key] += 1
-    close_readonly_database(db)
 
-    for key in uncited_events:
-        uncited_events[key] = (uncited_events[key], event_types[key])
-    for key in event_types:
-        event_types[key] = (event_types[key], total_events)
+    uncited_events = {
+        key: (uncited_events[key], total)
+        for (key, total) in event_types.items()
+    }
+    event_types = {
+        key: (value, total_events) for (key, value) in event_types.items()
+    }
 
     payload = {
         "event": {
@@ -639,16 +616,15 @@ def examine_events(args, queue=None, thread_event=None):
     return post_processing(args, "Events", total_events, queue, payload)
 
 
-def examine_places(args, queue=None, thread_event=None):
+def examine_places(db, args, queue=None, thread_event=None):
     """
     Parse and analyze places.
     """
     media, media_refs = 0, 0
     no_name, no_latitude, no_longitude, no_code = 0, 0, 0, 0
     uncited, private, tagged = 0, 0, 0
-    place_types = {}
+    place_types = defaultdict(int)
 
-    db = open_readonly_database(args.get("tree_name"))
     total_places = db.get_number_of_places()
 
     for place in db.iter_places():
@@ -661,8 +637,6 @@ def examine_places(args, queue=None, thread_event=None):
             media_refs += length
 
         place_type = place.get_type().serialize()
-        if place_type not in place_types:
-            place_types[place_type] = 0
         place_types[place_type] += 1
 
         if not place.name:
@@ -679,10 +653,10 @@ def examine_places(args, queue=None, thread_event=None):
             private += 1
         if place.tag_list:
             tagged += 1
-    close_readonly_database(db)
 
-    for key in place_types:
-        place_types[key] = (place_types[key], total_places)
+    place_types = {
+        key: (value, total_places) for (key, value) in place_types.items()
+    }
 
     payload = {
         "place": {
@@ -710,15 +684,15 @@ def examine_places(args, queue=None, thread_event=None):
     return post_processing(args, "Places", total_places, queue, payload)
 
 
-def examine_media(args, queue=None, thread_event=None):
+def examine_media(db, args, queue=None, thread_event=None):
     """
     Parse and analyze media objects.
     """
     no_desc, no_date, no_path, no_mime = 0, 0, 0, 0
     uncited, private, tagged, size_bytes = 0, 0, 0, 0
-    not_found = []
+    not_found = set()
+    media_paths = []
 
-    db = open_readonly_database(args.get("tree_name"))
     total_media = db.get_number_of_media()
 
     for media in db.iter_media():
@@ -738,13 +712,17 @@ def examine_media(args, queue=None, thread_event=None):
         if not media.path:
             no_path += 1
         else:
-            fullname = media_path_full(db, media.path)
-            try:
-                size_bytes += os.path.getsize(fullname)
-            except OSError:
-                if media.path not in not_found:
-                    not_found.append(media.path)
-    close_readonly_database(db)
+            media_paths.append((media.path, media_path_full(db, media.path)))
+
+    with ThreadPoolExecutor(max_workers=FILE_WORKERS) as executor:
+        sizes = executor.map(
+            get_file_size, [fullname for (dummy_path, fullname) in media_paths]
+        )
+        for ((path, dummy_fullname), size) in zip(media_paths, sizes):
+            if size is None:
+                not_found.add(path)
+            else:
+                size_bytes += size
 
     if not int(size_bytes / 1024):
         size_string = "%s bytes" % size_bytes
@@ -759,7 +737,7 @@ def examine_media(args, queue=None, thread_event=None):
             "size": (size_string, None),
             "no_path": (no_path, total_media),
             "no_file": (len(not_found), total_media - no_path),
-            "not_found": not_found,
+            "not_found": sorted(not_found),
             "no_description": (no_desc, total_media),
             "no_date": (no_date, total_media),
             "no_mime": (no_mime, total_media),
@@ -777,16 +755,15 @@ def examine_media(args, queue=None, thread_event=None):
     return post_processing(args, "Media", total_media, queue, payload)
 
 
-def examine_sources(args, queue=None, thread_event=None):
+def examine_sources(db, args, queue=None, thread_event=None):
     """
     Parse and analyze sources.
     """
     media, media_refs = 0, 0
     no_title, no_author, no_pubinfo, no_abbrev = 0, 0, 0, 0
     no_repository, repos_refs, no_call_number, private, tagged = 0, 0, 0, 0, 0
-    media_types = {}
+    media_types = defaultdict(int)
 
-    db = open_readonly_database(args.get("tree_name"))
     total_sources = db.get_number_of_sources()
 
     for source in db.iter_sources():
@@ -814,17 +791,15 @@ def examine_sources(args, queue=None, thread_event=None):
                 if not repo_ref.call_number:
                     no_call_number += 1
                 media_type = repo_ref.media_type.serialize()
-                if media_type not in media_types:
-                    media_types[media_type] = 0
                 media_types[media_type] += 1
         if source.private:
             private += 1
         if source.tag_list:
             tagged += 1
-    close_readonly_database(db)
 
-    for key in media_types:
-        media_types[key] = (media_types[key], repos_refs)
+    media_types = {
+        key: (value, repos_refs) for (key, value) in media_types.items()
+    }
 
     payload = {
         "source": {
@@ -852,15 +827,14 @@ def examine_sources(args, queue=None, thread_event=None):
     return post_processing(args, "Sources", total_sources, queue, payload)
 
 
-def examine_citations(args, queue=None, thread_event=None):
+def examine_citations(db, args, queue=None, thread_event=None):
     """
     Parse and analyze citation objects.
     """
     media, media_refs = 0, 0
     no_source, no_page, no_date, private, tagged = 0, 0, 0, 0, 0
-    very_low, low, normal, high, very_high = 0, 0, 0, 0, 0
+    confidence = [0] * (Citation.CONF_VERY_HIGH + 1)
 
-    db = open_readonly_database(args.get("tree_name"))
     total_citations = db.get_number_of_citations()
 
     for citation in db.iter_citations():
@@ -882,17 +856,7 @@ def examine_citations(args, queue=None, thread_event=None):
             private += 1
         if citation.tag_list:
             tagged += 1
-        if citation.confidence == Citation.CONF_VERY_LOW:
-            very_low += 1
-        elif citation.confidence == Citation.CONF_LOW:
-            low += 1
-        elif citation.confidence == Citation.CONF_NORMAL:
-            normal += 1
-        elif citation.confidence == Citation.CONF_HIGH:
-            high += 1
-        elif citation.confidence == Citation.CONF_VERY_HIGH:
-            very_high += 1
-    close_readonly_database(db)
+        confidence[citation.confidence] += 1
 
     payload = {
         "citation": {
@@ -914,6 +878,7 @@ def examine_citations(args, queue=None, thread_event=None):
         },
     }
     if total_citations:
+        very_low, low, normal, high, very_high = confidence
         payload["citation"]["confidence"].update(
             {
                 "very_low": (very_low, total_citations),
@@ -926,14 +891,13 @@ def examine_citations(args, queue=None, thread_event=None):
     return post_processing(args, "Citations", total_citations, queue, payload)
 
 
-def examine_repositories(args, queue=None, thread_event=None):
+def examine_repositories(db, args, queue=None, thread_event=None):
     """
     Parse and analyze repositories.
     """
     no_name, no_address, private, tagged = 0, 0, 0, 0
-    repository_types = {}
+    repository_types = defaultdict(int)
 
-    db = open_readonly_database(args.get("tree_name"))
     total_repositories = db.get_number_of_repositories()
 
     for repository in db.iter_repositories():
@@ -941,8 +905,6 @@ def examine_repositories(args, queue=None, thread_event=None):
             break
 
         repository_type = repository.get_type().serialize()
-        if repository_type not in repository_types:
-            repository_types[repository_type] = 0
         repository_types[repository_type] += 1
 
         if not repository.name:
@@ -953,10 +915,11 @@ def examine_repositories(args, queue=None, thread_event=None):
             private += 1
         if repository.tag_list:
             tagged += 1
-    close_readonly_database(db)
 
-    for key in repository_types:
-        repository_types[key] = (repository_types[key], total_repositories)
+    repository_types = {
+        key: (value, total_repositories)
+        for (key, value) in repository_types.items()
+    }
 
     payload = {
         "repository": {
@@ -977,14 +940,13 @@ def examine_repositories(args, queue=None, thread_event=None):
     )
 
 
-def examine_notes(args, queue=None, thread_event=None):
+def examine_notes(db, args, queue=None, thread_event=None):
     """
     Parse and analyze notes.
     """
     no_text, private, tagged = 0, 0, 0
-    note_types = {}
+    note_types = defaultdict(int)
 
-    db = open_readonly_database(args.get("tree_name"))
     total_notes = db.get_number_of_notes()
 
     for note in db.iter_notes():
@@ -992,8 +954,6 @@ def examine_notes(args, queue=None, thread_event=None):
             break
 
         note_type = note.get_type().serialize()
-        if note_type not in note_types:
-            note_types[note_type] = 0
         note_types[note_type] += 1
 
         if not note.text:
@@ -1002,10 +962,10 @@ def examine_notes(args, queue=None, thread_event=None):
             private += 1
         if note.tag_list:
             tagged += 1
-    close_readonly_database(db)
 
-    for key in note_types:
-        note_types[key] = (note_types[key], total_notes)
+    note_types = {
+        key: (value, total_notes) for (key, value) in note_types.items()
+    }
 
     payload = {
         "note": {
@@ -1023,13 +983,11 @@ def examine_notes(args, queue=None, thread_event=None):
     return post_processing(args, "Notes", total_notes, queue, payload)
 
 
-def examine_tags(args, queue=None, thread_event=None):
+def examine_tags(db, args, queue=None, thread_event=None):
     """
     Parse and analyze tags.
     """
-    db = open_readonly_database(args.get("tree_name"))
     total_tags = db.get_number_of_tags()
-    close_readonly_database(db)
 
     payload = {
         "tag": {"total": (total_tags, None)},
@@ -1037,11 +995,10 @@ def examine_tags(args, queue=None, thread_event=None):
     return post_processing(args, "Tags", total_tags, queue, payload)
 
 
-def examine_bookmarks(args):
+def examine_bookmarks(db, args):
     """
     Parse and analyze bookmarks.
     """
-    db = open_readonly_database(args.get("tree_name"))
     person_bookmarks = len(db.get_bookmarks().bookmarks)
     family_bookmarks = len(db.get_family_bookmarks().bookmarks)
     event_bookmarks = len(db.get_event_bookmarks().bookmarks)
@@ -1076,10 +1033,19 @@ def examine_bookmarks(args):
             "note": (note_bookmarks, total_bookmarks),
         }
     }
-    close_readonly_database(db)
     return post_processing(args, "Bookmarks", total_bookmarks, None, payload)
 
 
+def get_file_size(filename):
+    """
+    Return size of a file or None if it can not be accessed.
+    """
+    try:
+        return os.path.getsize(filename)
+    except OSError:
+        return None
+
+
 def open_readonly_database(dbname):
     """
     Open database for read only access.
@@ -1121,11 +1087,10 @@ def post_processing(args, obj_type, total, queue, payload):
         return payload
 
 
-def get_object_list(dbname):
+def get_object_list(db):
     """
     Prepare object list based on descending number of objects.
     """
-    db = open_readonly_database(dbname)
     object_list = [
         ("Person", db.get_number_of_people()),
         ("Family", db.get_number_of_families()),
@@ -1138,7 +1103,6 @@ def get_object_list(dbname):
         ("Note", db.get_number_of_notes()),
         ("Tag", db.get_number_of_tags()),
     ]
-    close_readonly_database(db)
     object_list.sort(key=lambda x: x[1], reverse=True)
     total = sum([y for (x, y) in object_list])
     return total, [x for (x, y) in object_list]
@@ -1148,13 +1112,13 @@ def fold(one, two):
     """
     Fold a set of dictionary entries into another.
     """
-    for key in two.keys():
-        if key not in one:
-            one.update({key: two[key]})
+    for (key, values) in two.items():
+        current = one.get(key)
+        if current is None:
+            one[key] = values
         else:
-            for subkey in two[key]:
-                if subkey not in one[key]:
-                    one[key].update({subkey: two[key][subkey]})
+            for (subkey, value) in values.items():
+                current.setdefault(subkey, value)
 
 
 TASK_HANDLERS = {
@@ -1170,40 +1134,58 @@ TASK_HANDLERS = {
     "Tag": examine_tags,
 }
 
+LARGE_TABLES = ["Person", "Family", "Event"]
+
 
-def gather_serial_statistics(args, obj_list, event=None):
+def gather_serial_statistics(db, args, obj_list, event=None):
     """
     Gather statistics using non-concurrent serial mode.
     """
-    facts = examine_bookmarks(args)
+    facts = examine_bookmarks(db, args)
     for obj_type in obj_list:
-        results = TASK_HANDLERS[obj_type](args, thread_event=event)
+        results = TASK_HANDLERS[obj_type](db, args, thread_event=event)
         if event.is_set():
             break
         fold(facts, results)
     return facts
 
 
-def gather_concurrent_statistics(args, obj_list, event=None):
+def examine_worker(obj_types, args, queue, event):
     """
-    Gather statistics using multiprocessing mode.
+    Open the database and run the handlers for a worker process.
     """
-    workers = {}
-    queues = {}
-    for obj_type in obj_list:
-        queues[obj_type] = Queue()
-        workers[obj_type] = Process(
-            target=TASK_HANDLERS[obj_type],
-            args=(args, queues[obj_type], event),
+    db = open_readonly_database(args.get("tree_name"))
+    for obj_type in obj_types:
+        TASK_HANDLERS[obj_type](db, args, queue, event)
+    close_readonly_database(db)
+
+
+def gather_concurrent_statistics(facts, args, obj_list, event=None):
+    """
+    Gather statistics using multiprocessing mode, folding the results
+    into the given facts.
+    """
+    worker_tasks = [
+        [obj_type] for obj_type in obj_list if obj_type in LARGE_TABLES
+    ]
+    worker_tasks.append(
+        [obj_type for obj_type in obj_list if obj_type not in LARGE_TABLES]
+    )
+
+    queue = SimpleQueue()
+    workers = []
+    for obj_types in worker_tasks:
+        worker = Process(
+            target=examine_worker,
+            args=(obj_types, args, queue, event),
         )
-        workers[obj_type].start()
+        worker.start()
+        workers.append(worker)
 
-    facts = examine_bookmarks(args)
-    obj_list.reverse()
-    for obj_type in obj_list:
-        result_set = queues[obj_type].get()
-        workers[obj_type].join()
-        fold(facts, result_set)
+    for dummy_obj_type in obj_list:
+        fold(facts, queue.get())
+    for worker in workers:
+        worker.join()
     return facts
 
 
@@ -1212,7 +1194,7 @@ def gather_statistics(args, event=None):
     Gather tree statistics.
     """
     try:
-        total, obj_list = get_object_list(args.get("tree_name"))
+        db = open_readonly_database(args.get("tree_name"))
     except TypeError:
         print(
             "Error: Problem finding and loading tree: %s"
@@ -1221,10 +1203,16 @@ def gather_statistics(args, event=None):
         )
         sys.exit(1)
 
+    total, obj_list = get_object_list(db)
     if args.get("serial"):
-        facts = gather_serial_statistics(args, obj_list, event=event)
+        facts = gather_serial_statistics(db, args, obj_list, event=event)
+        close_readonly_database(db)
     else:
-        facts = gather_concurrent_statistics(args, obj_list, event=event)
+        facts = examine_bookmarks(db, args)
+        close_readonly_database(db)
+        facts = gather_concurrent_statistics(
+            facts, args, obj_list, event=event
+        )
     return total, facts
 
 
@@ -1294,9 +1282,8 @@ def main():
         except ModuleNotFoundError:
             print("YAML support not available", file=sys.stderr)
     else:
-        # https://stackoverflow.com/questions/38029058/sending-pickled-data-to-a-server
-        sys.stdout = io.TextIOWrapper(sys.stdout.detach(), encoding="latin-1")
-        print(pickle.dumps(facts).decode("latin-1"), end="", flush=True)
+        sys.stdout.buffer.write(pickle.dumps(facts))
+        sys.stdout.buffer.flush()
     if parsed_args.time:
         print(
             "{0:<12} {1:6} {2}".format(
@@ -99,8 +99,8 @@ class PinnedViewWindow(ManagedWindow):
         ManagedWindow.__init__(self, grstate.uistate, [], grcontext)
 
         self.page_view = Gtk.VBox()
-        view = view_builder(grstate, grcontext, hint=self.hint)
-        self.page_view.pack_start(view, True, True, 0)
+        self.page_widget = view_builder(grstate, grcontext, hint=self.hint)
+        self.page_view.pack_start(self.page_widget, True, True, 0)
 
         window = Gtk.Window(type=Gtk.WindowType.TOPLEVEL)
         window.set_transient_for(self.uistate.window)
@@ -143,8 +143,9 @@ class PinnedViewWindow(ManagedWindow):
         Rebuild current page view.
         """
         view = view_builder(self.grstate, self.grcontext, hint=self.hint)
-        list(map(self.page_view.remove, self.page_view.get_children()))
-        self.page_view.pack_start(view, True, True, 0)
+        self.page_widget.destroy()
+        self.page_widget = view
+        self.page_view.pack_start(self.page_widget, True, True, 0)
         self.show()
 
     def reload(self, grcontext):
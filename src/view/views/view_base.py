@@ -28,6 +28,7 @@ GrampsObjectView
 #
 # -------------------------------------------------------------------------
 from abc import abstractmethod
+from functools import lru_cache
 
 # -------------------------------------------------------------------------
 #
@@ -57,6 +58,14 @@ from ..groups.group_builder import group_builder
 _ = glocale.translation.sgettext
 
 
+@lru_cache(maxsize=32)
+def split_layout_groups(groups):
+    """
+    Split a layout group list option.
+    """
+    return tuple(groups.split(","))
+
+
 # -------------------------------------------------------------------------
 #
 # GrampsObjectView Class
@@ -146,13 +155,9 @@ class GrampsObjectView(Gtk.VBox):
         scheme = global_config.get("colors.scheme")
         background = self.grstate.config.get("display.focal-object-color")
         card = Gtk.Frame()
-        css = "".join(
-            (
-                ".frame { border: 0px; padding: 3px; ",
-                "background-image: none; background-color: ",
-                background[scheme],
-                "; }",
-            )
+        css = (
+            ".frame { border: 0px; padding: 3px; background-image: none; "
+            "background-color: %s; }" % background[scheme]
         )
         css = css.encode("utf-8")
         provider = Gtk.CssProvider()
@@ -168,12 +173,19 @@ class GrampsObjectView(Gtk.VBox):
         Gather and build the object groups.
         """
         space = "layout.%s" % self.grcontext.page_type.lower()
-        groups = self.grstate.config.get("%s.groups" % space).split(",")
+        groups = self.get_layout_groups(space)
         object_groups = self.get_object_groups(
             space, groups, gramps_obj.obj, age_base=age_base
         )
         return self.render_group_view(object_groups)
 
+    def get_layout_groups(self, space):
+        """
+        Return the ordered groups configured for a layout.
+        """
+        groups = self.grstate.config.get("%s.groups" % space)
+        return split_layout_groups(groups)
+
     def get_object_groups(self, space, groups, obj, age_base=None):
         """
         Gather the visible object groups.
@@ -196,7 +208,7 @@ class GrampsObjectView(Gtk.VBox):
         space = (
             space_override or "layout.%s" % self.grcontext.page_type.lower()
         )
-        groups = self.grstate.config.get("%s.groups" % space).split(",")
+        groups = self.get_layout_groups(space)
         scrolled = self.grstate.config.get("%s.scrolled" % space)
         groupings = []
         current_grouping = []
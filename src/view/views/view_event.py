@@ -67,7 +67,7 @@ class EventObjectView(GrampsObjectView):
         self.view_focus = self.wrap_focal_widget(self.view_object)
         self.view_header.pack_start(self.view_focus, False, False, 0)
 
-        groups = self.grstate.config.get("layout.event.groups").split(",")
+        groups = self.get_layout_groups("layout.event")
         object_groups = self.get_object_groups(
             "layout.event", groups, event, age_base=event.get_date_object()
         )
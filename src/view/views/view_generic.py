@@ -83,7 +83,7 @@ class GenericObjectView(GrampsObjectView):
         build_card = CARD_MAP[secondary.obj_type]
         option_space = "active.%s" % secondary.obj_type.lower()
         groptions = GrampsOptions(option_space)
-        if "Ref" in secondary.obj_type:
+        if secondary.is_reference:
             groptions.set_ref_mode(2)
         return build_card(
             self.grstate,
@@ -63,7 +63,7 @@ class SourceObjectView(GrampsObjectView):
         self.view_focus = self.wrap_focal_widget(self.view_object)
         self.view_header.pack_start(self.view_focus, False, False, 0)
 
-        groups = self.grstate.config.get("layout.source.groups").split(",")
+        groups = self.get_layout_groups("layout.source")
         object_groups = self.get_object_groups("layout.source", groups, source)
         if "people" in groups or "event" in groups or "place" in groups:
             self.add_cited_subject_groups(source, object_groups)
@@ -57,7 +57,7 @@ class StatisticsObjectView(GrampsObjectView):
         """
         Gather and build the statistics groups.
         """
-        groups = self.grstate.config.get("layout.statistics.groups").split(",")
+        groups = self.get_layout_groups("layout.statistics")
 
         object_groups = {}
         for group in groups: